@@ -1,18 +1,113 @@
-from flask import Flask
-from exceptions import MoveNotPermittedError, FieldOutOfBoundsError
-from objects.Figure import Context, Pawn, Rook, King, Knight, Queen, Bishop
+from time import perf_counter
+
+from flask import Flask, Response, g, request
+from cache import ResponseCache, cached_response
+from formats import TEXT_FORMATS
+from exceptions import (
+    MoveNotPermittedError,
+    FieldOutOfBoundsError,
+    EmptyFieldError,
+    InvalidPositionError,
+    InvalidBoardError,
+)
+from objects.Figure import Context
+from objects.attacks import attack_map
+from objects.board import Board
+from objects.backends import get_figure_classes
+from objects.generators import get_move_generators
+from objects.geometry import get_board_geometry, parse_dimensions
+from objects.paths import PATH_TABLE
+from objects.puzzles import eight_queens, knights_tour, queen_coverage
+from objects.table_file import load_table_file
+from objects.transposition import CachedPositionFigure, TranspositionTable
+from objects.batch import list_moves_batch, validate_moves_batch
+from objects.results import (
+    FIELD_OUT_OF_BOUNDS_RESULT,
+    VALID,
+    UNKNOWN_FIGURE,
+    FIELD_OUT_OF_BOUNDS,
+    MOVE_NOT_PERMITTED,
+)
+from metrics import METRICS, PROFILER
+from settings import (
+    BATCH_MAX_SIZE,
+    FIGURE_BACKEND,
+    PUZZLE_TIME_BUDGET,
+    PUZZLE_MAX_TIME_BUDGET,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_MAX_AGE,
+    TABLE_FILE,
+    TRANSPOSITION_TABLE_BYTES,
+    TRANSPOSITION_TABLE_POLICY,
+)
+from squares import FIELD_SQUARES
 
 app = Flask(__name__)
 
 
-CLASS_NAMES = {
-    "pawn": Pawn,
-    "rook": Rook,
-    "king": King,
-    "knight": Knight,
-    "queen": Queen,
-    "bishop": Bishop,
-}
+CLASS_NAMES = get_figure_classes(FIGURE_BACKEND)
+TABLE_FILE_LOADED = bool(TABLE_FILE) and load_table_file(TABLE_FILE, CLASS_NAMES)
+if TABLE_FILE and not TABLE_FILE_LOADED:
+    app.logger.warning(
+        "Table file %s is missing or invalid, tables are computed.", TABLE_FILE
+    )
+MOVE_GENERATORS = get_move_generators(CLASS_NAMES)
+
+RESPONSE_CACHE = ResponseCache(RESPONSE_CACHE_SIZE)
+POSITION_TABLE = TranspositionTable(
+    TRANSPOSITION_TABLE_BYTES, TRANSPOSITION_TABLE_POLICY
+)
+
+
+@app.before_request
+def start_request_metrics():
+    if METRICS.enabled:
+        g.request_start = perf_counter()
+    if PROFILER.sample_rate > 0:
+        g.profile = PROFILER.start()
+
+
+@app.after_request
+def record_request_metrics(response: Response) -> Response:
+    profile = g.get("profile")
+    if profile is not None:
+        PROFILER.stop(profile)
+    request_start = g.get("request_start")
+    if request_start is not None:
+        figure = (request.view_args or {}).get("chess_figure")
+        METRICS.observe_request(
+            request.endpoint or "",
+            figure if figure in CLASS_NAMES else "",
+            response.status_code,
+            perf_counter() - request_start,
+        )
+    return response
+
+
+@app.route("/metrics")
+def handle_metrics():
+    return Response(METRICS.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/metrics/profile")
+def handle_profile():
+    return Response(PROFILER.report(), mimetype="text/plain")
+
+
+@app.route("/api/v1/cache/stats")
+def handle_cache_stats():
+    response_cache = dict(
+        entries=len(RESPONSE_CACHE),
+        maxSize=RESPONSE_CACHE.max_size,
+        hits=RESPONSE_CACHE.hits,
+        misses=RESPONSE_CACHE.misses,
+    )
+    table_file = dict(path=TABLE_FILE or None, loaded=TABLE_FILE_LOADED)
+    return dict(
+        responseCache=response_cache,
+        positionTable=POSITION_TABLE.stats(),
+        tableFile=table_file,
+    )
 
 
 @app.route("/")
@@ -21,42 +116,161 @@ def hello_world():
 
 
 @app.route("/api/v1/<chess_figure>/<current_field>")
+@cached_response(RESPONSE_CACHE, RESPONSE_CACHE_MAX_AGE)
 def handle_available_moves(chess_figure: str, current_field: str):
+    return get_available_moves(chess_figure, current_field)
+
+
+@app.route("/api/v1/<chess_figure>/<current_field>/<dest_field>")
+@cached_response(RESPONSE_CACHE, RESPONSE_CACHE_MAX_AGE)
+def handle_validate_move(chess_figure: str, current_field: str, dest_field: str):
+    return get_validate_move(chess_figure, current_field, dest_field)
+
+
+def get_available_moves(chess_figure: str, current_field: str) -> (dict, int):
+    generator = MOVE_GENERATORS.get(chess_figure)
+    if generator is None:
+        return get_json_object_list([], None, chess_figure, current_field), 404
+
+    with METRICS.stage("parse"):
+        square = FIELD_SQUARES.get(current_field)
+    if square is None:
+        result = FIELD_OUT_OF_BOUNDS_RESULT
+    else:
+        with METRICS.stage("generate"):
+            result = generator.moves_result(square)
+    return (
+        get_json_object_list(result.moves, result.error, chess_figure, current_field),
+        RESULT_STATUSES[result.code],
+    )
+
+
+def get_validate_move(
+    chess_figure: str, current_field: str, dest_field: str
+) -> (dict, int):
+    generator = MOVE_GENERATORS.get(chess_figure)
+    if generator is None:
+        return get_json_object_list(None, None, chess_figure, current_field), 404
+
+    with METRICS.stage("parse"):
+        square = FIELD_SQUARES.get(current_field)
+        dest_square = FIELD_SQUARES.get(dest_field)
+    with METRICS.stage("generate"):
+        result = generator.validate_result(square, dest_square)
+    move = "valid" if result.ok else "invalid"
+    return (
+        get_json_object_validate(
+            move, result.error, chess_figure, current_field, dest_field
+        ),
+        RESULT_STATUSES[result.code],
+    )
+
+
+RESULT_STATUSES = {
+    VALID: 200,
+    UNKNOWN_FIGURE: 404,
+    FIELD_OUT_OF_BOUNDS: 409,
+    MOVE_NOT_PERMITTED: 409,
+}
+
+
+@app.route("/api/v1/path/<chess_figure>/<current_field>/<dest_field>")
+@cached_response(RESPONSE_CACHE, RESPONSE_CACHE_MAX_AGE)
+def handle_shortest_path(chess_figure: str, current_field: str, dest_field: str):
     error = None
-    available_moves = list()
+    distance = None
+    path = None
     if chess_figure not in CLASS_NAMES:
         return (
-            get_json_object_list(available_moves, error, chess_figure, current_field),
+            get_json_object_path(
+                distance, path, error, chess_figure, current_field, dest_field
+            ),
             404,
         )
-
-    context = Context(CLASS_NAMES[chess_figure](current_field))
+    figure_class = CLASS_NAMES[chess_figure]
     try:
-        available_moves = context.list_moves()
+        distance = PATH_TABLE.distance(figure_class, current_field, dest_field)
     except FieldOutOfBoundsError as err:
         error = err.args[0]
         return (
-            get_json_object_list(available_moves, error, chess_figure, current_field),
+            get_json_object_path(
+                distance, path, error, chess_figure, current_field, dest_field
+            ),
+            409,
+        )
+    if distance is None:
+        error = "Field is not reachable."
+        return (
+            get_json_object_path(
+                distance, path, error, chess_figure, current_field, dest_field
+            ),
             409,
         )
+    path = PATH_TABLE.path(figure_class, current_field, dest_field)
     return (
-        get_json_object_list(available_moves, error, chess_figure, current_field),
+        get_json_object_path(
+            distance, path, error, chess_figure, current_field, dest_field
+        ),
         200,
     )
 
 
-@app.route("/api/v1/<chess_figure>/<current_field>/<dest_field>")
-def handle_validate_move(chess_figure: str, current_field: str, dest_field: str):
-    error = None
+@app.route("/api/v1/board/<dimensions>/<chess_figure>/<current_field>")
+@cached_response(RESPONSE_CACHE, RESPONSE_CACHE_MAX_AGE, TEXT_FORMATS)
+def handle_board_available_moves(
+    dimensions: str, chess_figure: str, current_field: str
+):
+    available_moves = list()
+    if chess_figure not in CLASS_NAMES:
+        return (
+            get_json_object_list(available_moves, None, chess_figure, current_field),
+            404,
+        )
+    try:
+        geometry = get_board_geometry(*parse_dimensions(dimensions))
+    except InvalidBoardError as err:
+        error = err.args[0]
+        return (
+            get_json_object_list(available_moves, error, chess_figure, current_field),
+            400,
+        )
+    try:
+        available_moves = geometry.moves(chess_figure, current_field)
+    except FieldOutOfBoundsError as err:
+        error = err.args[0]
+        return (
+            get_json_object_list(available_moves, error, chess_figure, current_field),
+            409,
+        )
+    return get_json_object_list(available_moves, None, chess_figure, current_field), 200
+
+
+@app.route("/api/v1/board/<dimensions>/<chess_figure>/<current_field>/<dest_field>")
+@cached_response(RESPONSE_CACHE, RESPONSE_CACHE_MAX_AGE, TEXT_FORMATS)
+def handle_board_validate_move(
+    dimensions: str, chess_figure: str, current_field: str, dest_field: str
+):
     move = None
     if chess_figure not in CLASS_NAMES:
         return (
-            get_json_object_list(move, error, chess_figure, current_field),
+            get_json_object_validate(
+                move, None, chess_figure, current_field, dest_field
+            ),
             404,
         )
-    context = Context(CLASS_NAMES[chess_figure](current_field))
     try:
-        context.validate_move(dest_field)
+        geometry = get_board_geometry(*parse_dimensions(dimensions))
+    except InvalidBoardError as err:
+        error = err.args[0]
+        return (
+            get_json_object_validate(
+                move, error, chess_figure, current_field, dest_field
+            ),
+            400,
+        )
+    try:
+        if not geometry.is_permitted(chess_figure, current_field, dest_field):
+            raise MoveNotPermittedError("Current move is not permitted.")
         move = "valid"
     except (MoveNotPermittedError, FieldOutOfBoundsError) as err:
         move = "invalid"
@@ -68,11 +282,208 @@ def handle_validate_move(chess_figure: str, current_field: str, dest_field: str)
             409,
         )
     return (
-        get_json_object_validate(move, error, chess_figure, current_field, dest_field),
+        get_json_object_validate(move, None, chess_figure, current_field, dest_field),
+        200,
+    )
+
+
+@app.route("/api/v1/position/<current_field>")
+def handle_position_available_moves(current_field: str):
+    figure = None
+    available_moves = list()
+    try:
+        board = Board.from_fen(request.args.get("fen"))
+    except InvalidPositionError as err:
+        error = err.args[0]
+        return get_json_object_list(available_moves, error, figure, current_field), 400
+
+    strategy = CachedPositionFigure(current_field, board, POSITION_TABLE)
+    try:
+        figure = strategy.figure_name
+        available_moves = Context(strategy).list_moves()
+    except (FieldOutOfBoundsError, EmptyFieldError) as err:
+        error = err.args[0]
+        return get_json_object_list(available_moves, error, figure, current_field), 409
+    return get_json_object_list(available_moves, None, figure, current_field), 200
+
+
+@app.route("/api/v1/position/<current_field>/<dest_field>")
+def handle_position_validate_move(current_field: str, dest_field: str):
+    figure = None
+    move = None
+    try:
+        board = Board.from_fen(request.args.get("fen"))
+    except InvalidPositionError as err:
+        error = err.args[0]
+        return (
+            get_json_object_validate(move, error, figure, current_field, dest_field),
+            400,
+        )
+
+    strategy = CachedPositionFigure(current_field, board, POSITION_TABLE)
+    try:
+        figure = strategy.figure_name
+        Context(strategy).validate_move(dest_field)
+        move = "valid"
+    except (MoveNotPermittedError, FieldOutOfBoundsError, EmptyFieldError) as err:
+        move = "invalid"
+        error = err.args[0]
+        return (
+            get_json_object_validate(move, error, figure, current_field, dest_field),
+            409,
+        )
+    return (
+        get_json_object_validate(move, None, figure, current_field, dest_field),
         200,
     )
 
 
+@app.route("/api/v1/batch/moves", methods=["POST"])
+def handle_batch_available_moves():
+    queries, error, status = get_batch_queries(("figure", "currentField"))
+    if error is not None:
+        return dict(results=[], error=error), status
+
+    known_queries = [
+        (CLASS_NAMES[figure], current_field)
+        for figure, current_field in queries
+        if figure in CLASS_NAMES
+    ]
+    known_results = iter(list_moves_batch(known_queries))
+    results = list()
+    for figure, current_field in queries:
+        if figure not in CLASS_NAMES:
+            result, status = get_json_object_list([], None, figure, current_field), 404
+        else:
+            available_moves = next(known_results)
+            if available_moves is None:
+                error, status = "Field does not exist.", 409
+                available_moves = list()
+            else:
+                error, status = None, 200
+            result = get_json_object_list(available_moves, error, figure, current_field)
+        result["status"] = status
+        results.append(result)
+    return dict(results=results, error=None), 200
+
+
+@app.route("/api/v1/batch/validate", methods=["POST"])
+def handle_batch_validate_move():
+    queries, error, status = get_batch_queries(("figure", "currentField", "destField"))
+    if error is not None:
+        return dict(results=[], error=error), status
+
+    figures, current_fields, dest_fields = zip(*queries) if queries else ((), (), ())
+    _, errors = validate_moves_batch(CLASS_NAMES, figures, current_fields, dest_fields)
+    results = list()
+    for (figure, current_field, dest_field), error_code in zip(
+        queries, errors.tolist()
+    ):
+        move, error, status = BATCH_VALIDATE_RESULTS[error_code]
+        result = get_json_object_validate(
+            move, error, figure, current_field, dest_field
+        )
+        result["status"] = status
+        results.append(result)
+    return dict(results=results, error=None), 200
+
+
+BATCH_VALIDATE_RESULTS = {
+    VALID: ("valid", None, 200),
+    UNKNOWN_FIGURE: (None, None, 404),
+    FIELD_OUT_OF_BOUNDS: ("invalid", "Field does not exist.", 409),
+    MOVE_NOT_PERMITTED: ("invalid", "Current move is not permitted.", 409),
+}
+
+
+@app.route("/api/v1/attacks", methods=["POST"])
+def handle_attack_map():
+    pieces, error, status = get_batch_queries(("figure", "currentField"), "pieces")
+    if error is not None:
+        return dict(attacks=None, error=error), status
+
+    figures = [figure for figure, _ in pieces]
+    if any(figure not in CLASS_NAMES for figure in figures):
+        return dict(attacks=None, error=None), 404
+    try:
+        attacks = attack_map(CLASS_NAMES, figures, [field for _, field in pieces])
+    except FieldOutOfBoundsError as err:
+        return dict(attacks=None, error=err.args[0]), 409
+    return dict(attacks=attacks.tolist(), error=None), 200
+
+
+@app.route("/api/v1/puzzles/knights-tour/<current_field>")
+def handle_knights_tour(current_field: str):
+    budget, error = get_time_budget()
+    if error is not None:
+        return dict(tour=None, nodes=0, error=error, currentField=current_field), 400
+    try:
+        tour, nodes = knights_tour(current_field, budget)
+    except FieldOutOfBoundsError as err:
+        error = err.args[0]
+        return dict(tour=None, nodes=0, error=error, currentField=current_field), 409
+    if tour is None:
+        error = "Puzzle was not solved within the time budget."
+        return (
+            dict(tour=None, nodes=nodes, error=error, currentField=current_field),
+            409,
+        )
+    return dict(tour=tour, nodes=nodes, error=None, currentField=current_field), 200
+
+
+@app.route("/api/v1/puzzles/eight-queens")
+def handle_eight_queens():
+    budget, error = get_time_budget()
+    if error is not None:
+        return dict(solutions=None, count=0, nodes=0, error=error), 400
+    solutions, nodes = eight_queens(budget)
+    if solutions is None:
+        error = "Puzzle was not solved within the time budget."
+        return dict(solutions=None, count=0, nodes=nodes, error=error), 409
+    return dict(solutions=solutions, count=len(solutions), nodes=nodes, error=None), 200
+
+
+@app.route("/api/v1/puzzles/queen-coverage")
+def handle_queen_coverage():
+    budget, error = get_time_budget()
+    if error is not None:
+        return dict(queens=None, nodes=0, error=error), 400
+    queens, nodes = queen_coverage(budget)
+    if queens is None:
+        error = "Puzzle was not solved within the time budget."
+        return dict(queens=None, nodes=nodes, error=error), 409
+    return dict(queens=queens, nodes=nodes, error=None), 200
+
+
+def get_time_budget() -> (float, str):
+    # seconds from the budget query parameter, capped at the maximum
+    try:
+        budget = float(request.args.get("budget", PUZZLE_TIME_BUDGET))
+    except ValueError:
+        budget = None
+    if budget is None or not budget > 0:
+        return None, "Budget must be a positive number of seconds."
+    return min(budget, PUZZLE_MAX_TIME_BUDGET), None
+
+
+def get_batch_queries(keys: tuple, collection: str = "queries") -> (list, str, int):
+    body = request.get_json(silent=True)
+    queries = body.get(collection) if isinstance(body, dict) else None
+    if not isinstance(queries, list) or not all(
+        isinstance(query, dict) for query in queries
+    ):
+        return None, f"Request body must contain a list of {collection}.", 400
+    if len(queries) > BATCH_MAX_SIZE:
+        return None, f"Batch size is limited to {BATCH_MAX_SIZE} queries.", 413
+    queries = [
+        tuple(
+            query.get(key) if isinstance(query.get(key), str) else None for key in keys
+        )
+        for query in queries
+    ]
+    return queries, None, 200
+
+
 def get_json_object_list(moves, error, figure, current_field):
     return dict(
         availableMoves=moves, error=error, figure=figure, currentField=current_field
@@ -89,5 +500,16 @@ def get_json_object_validate(moves, error, figure, current_field, dest_field):
     )
 
 
+def get_json_object_path(distance, path, error, figure, current_field, dest_field):
+    return dict(
+        distance=distance,
+        path=path,
+        figure=figure,
+        error=error,
+        currentField=current_field,
+        destField=dest_field,
+    )
+
+
 if __name__ == "__main__":
     app.run()
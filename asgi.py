@@ -0,0 +1,140 @@
+import json
+
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header, parse_etags
+
+from app import RESPONSE_CACHE, get_available_moves, get_validate_move
+from cache import cache_key, cached_entry, serialize_response
+from formats import encode_json, negotiate
+from settings import BATCH_MAX_SIZE, RESPONSE_CACHE_MAX_AGE
+from wsgi import warm_move_tables
+
+API_PREFIX = ("api", "v1")
+WEBSOCKET_PATH = "/api/v1/ws"
+
+
+def route(path: str):
+    # returns a callable rendering the (dict, status) response of the path
+    parts = path.strip("/").split("/")
+    if tuple(parts[:2]) != API_PREFIX or any(part == "" for part in parts):
+        return None
+    if len(parts) == 4:
+        return lambda: get_available_moves(*parts[2:])
+    if len(parts) == 5:
+        return lambda: get_validate_move(*parts[2:])
+    return None
+
+
+async def application(scope: dict, receive, send) -> None:
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+        return
+    if scope["type"] == "websocket":
+        await websocket_session(scope, receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    render = route(scope["path"])
+    if scope["method"] != "GET":
+        entry = serialize_response(dict(error="Method not allowed."), 405)
+    elif render is None:
+        entry = serialize_response(dict(error="Not found."), 404)
+    else:
+        accept = request_header(scope, b"accept")
+        mimetype = negotiate(parse_accept_header(accept, MIMEAccept))
+        entry = cached_entry(
+            RESPONSE_CACHE, cache_key(scope["path"], mimetype), render, mimetype
+        )
+
+    headers = [
+        (b"cache-control", f"public, max-age={RESPONSE_CACHE_MAX_AGE}".encode()),
+        (b"vary", b"Accept"),
+    ]
+    status, body = entry.status, entry.body
+    # only successful responses can be revalidated, as in cached_response
+    if 200 <= entry.status < 300:
+        headers.append((b"etag", f'"{entry.etag}"'.encode()))
+        if parse_etags(request_header(scope, b"if-none-match")).contains(entry.etag):
+            status, body = 304, b""
+    if status != 304:
+        headers.append((b"content-type", entry.mimetype.encode()))
+        headers.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def websocket_session(scope: dict, receive, send) -> None:
+    # one connection streams answers to any number of queries, an idle
+    # connection is a single coroutine waiting in receive
+    message = await receive()
+    if message["type"] != "websocket.connect":
+        return
+    if scope["path"] != WEBSOCKET_PATH:
+        await send({"type": "websocket.close", "code": 4404})
+        return
+    await send({"type": "websocket.accept"})
+    while True:
+        message = await receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        text = message.get("text")
+        if text is None:
+            text = (message.get("bytes") or b"").decode("utf-8", "replace")
+        answer = encode_json(answer_queries(text)).decode("utf-8")
+        await send({"type": "websocket.send", "text": answer})
+
+
+def answer_queries(text: str) -> dict:
+    # a query is {"figure", "currentField"} and an optional "destField" to
+    # validate, a message is one query or a list answered in order
+    try:
+        queries = json.loads(text)
+    except ValueError:
+        queries = None
+    if isinstance(queries, dict):
+        return answer_query(queries)
+    if not isinstance(queries, list) or not all(
+        isinstance(query, dict) for query in queries
+    ):
+        return dict(error="Message must be a query or a list of queries.", status=400)
+    if len(queries) > BATCH_MAX_SIZE:
+        return dict(
+            error=f"Batch size is limited to {BATCH_MAX_SIZE} queries.", status=413
+        )
+    return dict(results=[answer_query(query) for query in queries], error=None)
+
+
+def answer_query(query: dict) -> dict:
+    # non-string values are answered like fields that do not exist
+    figure, current_field, dest_field = (
+        query.get(key) if isinstance(query.get(key), str) else None
+        for key in ("figure", "currentField", "destField")
+    )
+    if "destField" in query:
+        result, status = get_validate_move(figure, current_field, dest_field)
+    else:
+        result, status = get_available_moves(figure, current_field)
+    result["status"] = status
+    if "id" in query:
+        result["id"] = query["id"]
+    return result
+
+
+def request_header(scope: dict, header: bytes) -> str:
+    # header is the lowercase name, as ASGI servers pass them
+    for name, value in scope.get("headers", ()):
+        if name == header:
+            return value.decode("latin-1")
+    return None
+
+
+async def lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            warm_move_tables()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
@@ -0,0 +1,67 @@
+import argparse
+
+from benchmarks.common import environment, summarize, time_calls, write_results
+from objects.geometry import FIGURE_SHIFTS, BoardGeometry
+
+
+def loop_table(geometry: BoardGeometry, figure: str) -> list:
+    # the per-ray Python walk of the 8x8 figures, generalized for reference
+    shifts, sliding = FIGURE_SHIFTS[figure]
+    table = list()
+    for index in range(len(geometry.fields)):
+        row, column = divmod(index, geometry.columns)
+        moves = list()
+        for row_shift, column_shift in shifts:
+            x, y = row + row_shift, column + column_shift
+            while 0 <= x < geometry.rows and 0 <= y < geometry.columns:
+                moves.append(x * geometry.columns + y)
+                if not sliding:
+                    break
+                x, y = x + row_shift, y + column_shift
+        table.append(moves)
+    return table
+
+
+def build_vectorized(size: int) -> None:
+    geometry = BoardGeometry(size, size)
+    for figure in FIGURE_SHIFTS:
+        geometry.table(figure)
+
+
+def build_loop(size: int) -> None:
+    geometry = BoardGeometry(size, size)
+    for figure in FIGURE_SHIFTS:
+        loop_table(geometry, figure)
+
+
+def bench_board(size: int, repeat: int) -> dict:
+    geometry = BoardGeometry(size, size)
+    lookup_args = [("queen", field) for field in geometry.fields]
+    validate_args = [("queen", field, geometry.fields[0]) for field in geometry.fields]
+    build_vectorized(size)
+    return dict(
+        fields=len(geometry.fields),
+        build_vectorized=summarize(time_calls(build_vectorized, [(size,)], repeat)),
+        build_loop=summarize(time_calls(build_loop, [(size,)], repeat)),
+        moves=summarize(time_calls(geometry.moves, lookup_args, 1)),
+        is_permitted=summarize(time_calls(geometry.is_permitted, validate_args, 1)),
+    )
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Board dimension benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 26])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    results = dict(
+        environment=environment(),
+        boards={str(size): bench_board(size, args.repeat) for size in args.sizes},
+    )
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+
+from app import app
+from benchmarks.common import environment, summarize, time_calls, write_results
+from formats import ALL_FORMATS, ENCODERS, encode_json
+
+ROUTES = {
+    "queen_moves": "/api/v1/queen/D4",
+    "pawn_moves": "/api/v1/pawn/H4",
+    "validate": "/api/v1/rook/H4/H3",
+    "path": "/api/v1/path/knight/A1/H8",
+}
+
+
+def route_payloads() -> dict:
+    # the (dict, status) the views render, taken from their JSON responses
+    client = app.test_client()
+    return {name: client.get(path).get_json() for name, path in ROUTES.items()}
+
+
+def encode(mimetype: str, payload: dict) -> bytes:
+    body = ENCODERS[mimetype](payload)
+    return encode_json(payload) if body is None else body
+
+
+def bench_formats(repeat: int) -> dict:
+    results = dict()
+    for name, payload in route_payloads().items():
+        results[name] = {
+            mimetype: dict(
+                bytes=len(encode(mimetype, payload)),
+                encode=summarize(time_calls(encode, [(mimetype, payload)], repeat)),
+            )
+            for mimetype in ALL_FORMATS
+        }
+    return results
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Response format benchmarks")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    results = dict(environment=environment(), formats=bench_formats(args.repeat))
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
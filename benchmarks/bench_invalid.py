@@ -0,0 +1,75 @@
+import argparse
+
+from app import app, MOVE_GENERATORS, RESPONSE_CACHE
+from benchmarks.common import environment, summarize, time_calls, write_results
+from exceptions import FieldOutOfBoundsError, MoveNotPermittedError
+from squares import FIELD_SQUARES
+
+# (current field, destination) of valid moves, disallowed moves and fields
+# that do not exist, as scanners and bad clients send them
+CASES = {
+    "valid": [("H4", "H3"), ("D4", "D8"), ("A1", "H1")],
+    "not_permitted": [("H4", "G3"), ("D4", "E6"), ("A1", "B2")],
+    "out_of_bounds": [("H9", "H3"), ("Z4", "D8"), ("../etc", "A1")],
+}
+
+
+def validate_with_exceptions(generator, field: str, dest_field: str) -> bool:
+    try:
+        generator.validate_move(field, dest_field)
+    except (FieldOutOfBoundsError, MoveNotPermittedError):
+        return False
+    return True
+
+
+def validate_with_results(generator, field: str, dest_field: str) -> bool:
+    return generator.validate_result(
+        FIELD_SQUARES.get(field), FIELD_SQUARES.get(dest_field)
+    ).ok
+
+
+def bench_api(repeat: int) -> dict:
+    generator = MOVE_GENERATORS["rook"]
+    results = dict()
+    for case, moves in CASES.items():
+        args = [(generator, field, dest_field) for field, dest_field in moves]
+        results[case] = dict(
+            exceptions=summarize(time_calls(validate_with_exceptions, args, repeat)),
+            results=summarize(time_calls(validate_with_results, args, repeat)),
+        )
+    return results
+
+
+def bench_routes(repeat: int) -> dict:
+    # the response cache is off, so every request runs the handler
+    client = app.test_client()
+    max_size, RESPONSE_CACHE.max_size = RESPONSE_CACHE.max_size, 0
+    try:
+        results = dict()
+        for case, moves in CASES.items():
+            args = [(f"/api/v1/rook/{field}/{dest}",) for field, dest in moves]
+            args += [(f"/api/v1/rook/{field}",) for field, _ in moves]
+            results[case] = summarize(time_calls(client.get, args, repeat))
+    finally:
+        RESPONSE_CACHE.max_size = max_size
+    return results
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Invalid input benchmarks")
+    parser.add_argument("--repeat", type=int, default=5000)
+    parser.add_argument("--route-repeat", type=int, default=100)
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    results = dict(
+        environment=environment(),
+        api=bench_api(args.repeat),
+        routes=bench_routes(args.route_repeat),
+    )
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import random
+
+from app import app, CLASS_NAMES
+from benchmarks.common import environment, summarize, time_calls, write_results
+from exceptions import MoveNotPermittedError
+from objects.attacks import attack_map
+from squares import SQUARES
+
+
+def validate(figure_class: type, field: str, dest_field: str) -> None:
+    try:
+        figure_class(field).validate_move(dest_field)
+    except MoveNotPermittedError:
+        pass
+
+
+def list_moves(figure_class: type, field: str) -> None:
+    figure_class(field).list_available_moves()
+
+
+def bench_figures(repeat: int) -> dict:
+    results = dict()
+    for name, figure_class in CLASS_NAMES.items():
+        list_args = [(figure_class, field) for field in SQUARES]
+        validate_args = [(figure_class, field, "D4") for field in SQUARES]
+        per_square = {
+            field: summarize(time_calls(list_moves, [(figure_class, field)], repeat))
+            for field in SQUARES
+        }
+        results[name] = dict(
+            list_available_moves=summarize(time_calls(list_moves, list_args, repeat)),
+            validate_move=summarize(time_calls(validate, validate_args, repeat)),
+            list_available_moves_per_square=per_square,
+        )
+    return results
+
+
+def bench_routes(repeat: int) -> dict:
+    client = app.test_client()
+    results = dict()
+    for name in CLASS_NAMES:
+        list_args = [(f"/api/v1/{name}/{field}",) for field in SQUARES]
+        validate_args = [(f"/api/v1/{name}/{field}/D4",) for field in SQUARES]
+        results[name] = dict(
+            available_moves=summarize(time_calls(client.get, list_args, repeat)),
+            validate_move=summarize(time_calls(client.get, validate_args, repeat)),
+        )
+    return results
+
+
+def bench_attack_map(repeat: int, piece_counts: tuple = (16, 100, 500)) -> dict:
+    results = dict()
+    rng = random.Random(0)
+    for piece_count in piece_counts:
+        figures = [rng.choice(list(CLASS_NAMES)) for _ in range(piece_count)]
+        fields = [rng.choice(SQUARES) for _ in range(piece_count)]
+        args = [(CLASS_NAMES, figures, fields)]
+        results[str(piece_count)] = summarize(time_calls(attack_map, args, repeat))
+    return results
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Move generation benchmarks")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--route-repeat", type=int, default=3)
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    results = dict(
+        environment=environment(),
+        figures=bench_figures(args.repeat),
+        routes=bench_routes(args.route_repeat),
+        attack_map=bench_attack_map(args.repeat),
+    )
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import argparse
+import os
+import random
+import time
+
+from benchmarks.common import environment, write_results
+from objects.backends import FIGURE_BACKENDS
+from objects.board import Board, START_FEN
+from objects.parallel import create_pool, parallel_perft, validate_moves_parallel
+from squares import SQUARES
+
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def default_worker_counts() -> list:
+    counts, workers = list(), 1
+    while workers < (os.cpu_count() or 1):
+        counts.append(workers)
+        workers *= 2
+    return counts + [os.cpu_count() or 1]
+
+
+def scaling(timings: dict) -> dict:
+    # speedup against one worker and efficiency, speedup divided by workers
+    serial = timings[1]
+    return {
+        str(workers): dict(
+            seconds=seconds,
+            speedup=serial / seconds,
+            efficiency=serial / seconds / workers,
+        )
+        for workers, seconds in timings.items()
+    }
+
+
+def timed(repeat: int, func, *args) -> float:
+    # best of repeat runs, the first one also pays for imports and warm up
+    samples = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def bench_perft(fen: str, depth: int, worker_counts: list, repeat: int) -> dict:
+    timings = dict()
+    for workers in worker_counts:
+        # the pool is created outside the timing, it is reused by bulk jobs
+        with create_pool(workers) as pool:
+            board = Board.from_fen(fen)
+            timings[workers] = timed(
+                repeat, parallel_perft, board, depth, workers, pool
+            )
+    return dict(fen=fen, depth=depth, scaling=scaling(timings))
+
+
+def bench_validate(
+    size: int, chunk_size: int, worker_counts: list, repeat: int
+) -> dict:
+    figure_classes = FIGURE_BACKENDS["table"]
+    rng = random.Random(0)
+    figures = [rng.choice(list(figure_classes)) for _ in range(size)]
+    currents = [rng.choice(SQUARES) for _ in range(size)]
+    dests = [rng.choice(SQUARES) for _ in range(size)]
+    timings = dict()
+    for workers in worker_counts:
+        with create_pool(workers, figure_classes) as pool:
+            timings[workers] = timed(
+                repeat,
+                validate_moves_parallel,
+                figure_classes,
+                figures,
+                currents,
+                dests,
+                workers,
+                pool,
+                chunk_size,
+            )
+    return dict(size=size, chunk_size=chunk_size, scaling=scaling(timings))
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Process pool scaling benchmarks")
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--validate-size", type=int, default=1 << 20)
+    parser.add_argument("--chunk-size", type=int, default=1 << 16)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    worker_counts = sorted(set([1] + (args.workers or default_worker_counts())))
+    results = dict(
+        environment=dict(environment(), cpu_count=os.cpu_count()),
+        perft=dict(
+            start=bench_perft(START_FEN, args.depth, worker_counts, args.repeat),
+            kiwipete=bench_perft(
+                KIWIPETE_FEN, args.depth - 1, worker_counts, args.repeat
+            ),
+        ),
+        validate=bench_validate(
+            args.validate_size, args.chunk_size, worker_counts, args.repeat
+        ),
+    )
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import argparse
+
+from benchmarks.common import environment, summarize, time_calls, write_results
+from objects.puzzles import eight_queens, knights_tour, queen_coverage
+from squares import SQUARES
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Puzzle solver benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=30.0)
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    tour_args = [(field, args.budget) for field in SQUARES]
+    results = dict(
+        environment=environment(),
+        knights_tour=summarize(time_calls(knights_tour, tour_args, args.repeat)),
+        eight_queens=summarize(time_calls(eight_queens, [(args.budget,)], args.repeat)),
+        queen_coverage=summarize(
+            time_calls(queen_coverage, [(args.budget,)], args.repeat)
+        ),
+    )
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.common import environment, summarize, write_results
+from objects.table_file import build_table_file
+
+# each scenario is a list of modules imported in order by a fresh interpreter,
+# "app_with_numpy" reproduces the cost of app when NumPy was loaded at import
+SCENARIOS = {
+    "app": ["app"],
+    "app_with_numpy": ["numpy", "app"],
+    "numpy": ["numpy"],
+    "wsgi": ["wsgi"],
+}
+
+CHILD = """
+import importlib, json, sys, time
+start = time.perf_counter_ns()
+for module in sys.argv[1:]:
+    importlib.import_module(module)
+print(json.dumps(dict(import_ns=time.perf_counter_ns() - start,
+                      numpy_loaded="numpy" in sys.modules)))
+"""
+
+
+def run_scenario(modules: list, repeat: int, env: dict = None) -> dict:
+    import_samples, process_samples, numpy_loaded = list(), list(), False
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD, *modules],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, **(env or dict())),
+        ).stdout
+        process_samples.append(time.perf_counter_ns() - start)
+        result = json.loads(output)
+        import_samples.append(result["import_ns"])
+        numpy_loaded = result["numpy_loaded"]
+    return dict(
+        modules=modules,
+        numpy_loaded=numpy_loaded,
+        import_time=summarize(import_samples),
+        process_time=summarize(process_samples),
+    )
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Import and startup benchmarks")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--table-file", help="also start wsgi from this table file, built first"
+    )
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    startup = {
+        name: run_scenario(modules, args.repeat, dict(TABLE_FILE=""))
+        for name, modules in SCENARIOS.items()
+    }
+    if args.table_file:
+        build_table_file(args.table_file)
+        startup["wsgi_table_file"] = run_scenario(
+            SCENARIOS["wsgi"], args.repeat, dict(TABLE_FILE=args.table_file)
+        )
+    results = dict(environment=environment(), startup=startup)
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
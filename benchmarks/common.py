@@ -0,0 +1,54 @@
+import json
+import math
+import platform
+import sys
+import time
+
+
+def time_calls(func, args_list: list, repeat: int) -> list:
+    # latency of every single call in nanoseconds
+    samples = list()
+    perf_counter_ns = time.perf_counter_ns
+    for _ in range(repeat):
+        for args in args_list:
+            start = perf_counter_ns()
+            func(*args)
+            samples.append(perf_counter_ns() - start)
+    return samples
+
+
+def percentile(sorted_samples: list, fraction: float) -> int:
+    index = max(math.ceil(fraction * len(sorted_samples)) - 1, 0)
+    return sorted_samples[index]
+
+
+def summarize(samples: list) -> dict:
+    sorted_samples = sorted(samples)
+    total = sum(sorted_samples)
+    return dict(
+        count=len(sorted_samples),
+        mean_ns=total / len(sorted_samples),
+        p50_ns=percentile(sorted_samples, 0.5),
+        p99_ns=percentile(sorted_samples, 0.99),
+        min_ns=sorted_samples[0],
+        max_ns=sorted_samples[-1],
+        ops_per_sec=len(sorted_samples) / total * 1e9 if total else None,
+    )
+
+
+def environment() -> dict:
+    return dict(
+        python=sys.version.split()[0],
+        implementation=platform.python_implementation(),
+        machine=platform.machine(),
+        timestamp=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    )
+
+
+def write_results(results: dict, output: str) -> None:
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if output == "-":
+        print(text)
+    else:
+        with open(output, "w") as file:
+            file.write(text + "\n")
@@ -0,0 +1,49 @@
+import argparse
+import json
+import sys
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    # maps "figures.rook.validate_move" style keys to their summaries
+    flat = dict()
+    for key, value in results.items():
+        if not isinstance(value, dict):
+            continue
+        name = f"{prefix}{key}"
+        if "p50_ns" in value:
+            flat[name] = value
+        else:
+            flat.update(flatten(value, f"{name}."))
+    return flat
+
+
+def compare(baseline: dict, current: dict, metric: str, threshold: float) -> list:
+    regressions = list()
+    baseline, current = flatten(baseline), flatten(current)
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name][metric], current[name][metric]
+        if before and after > before * (1 + threshold):
+            regressions.append((name, before, after))
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--metric", default="p50_ns", choices=["p50_ns", "p99_ns"])
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.metric, args.threshold)
+    for name, before, after in regressions:
+        print(f"{name}: {args.metric} {before} -> {after}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import argparse
+import http.client
+import itertools
+import threading
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.common import environment, summarize, write_results
+from squares import SQUARES
+
+FIGURES = ("pawn", "rook", "king", "knight", "queen", "bishop")
+
+
+def request_paths() -> list:
+    paths = [f"/api/v1/{figure}/{field}" for figure in FIGURES for field in SQUARES]
+    paths.extend(
+        f"/api/v1/{figure}/{field}/D4" for figure in FIGURES for field in SQUARES
+    )
+    return paths
+
+
+def worker(url: str, next_path, deadline: float, samples: list, errors: list) -> None:
+    # one keep-alive connection per worker thread
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=10)
+    perf_counter_ns = time.perf_counter_ns
+    while time.monotonic() < deadline:
+        path = next_path()
+        start = perf_counter_ns()
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(path)
+            connection.close()
+            continue
+        samples.append(perf_counter_ns() - start)
+        if response.status >= 500:
+            errors.append(path)
+    connection.close()
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="HTTP load test of the move API")
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    paths = itertools.cycle(request_paths())
+    paths_lock = threading.Lock()
+
+    def next_path() -> str:
+        with paths_lock:
+            return next(paths)
+
+    samples, errors = list(), list()
+    deadline = time.monotonic() + args.duration
+    threads = [
+        threading.Thread(
+            target=worker, args=(args.url, next_path, deadline, samples, errors)
+        )
+        for _ in range(args.concurrency)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    results = dict(
+        environment=environment(),
+        url=args.url,
+        concurrency=args.concurrency,
+        duration_s=elapsed,
+        requests=len(samples),
+        errors=len(errors),
+        requests_per_sec=len(samples) / elapsed,
+        latency=summarize(samples) if samples else None,
+    )
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import itertools
+import json
+import resource
+import time
+
+import websockets
+
+from benchmarks.common import environment, summarize, write_results
+from benchmarks.load_test import FIGURES
+from squares import SQUARES
+
+
+def queries() -> list:
+    moves = [
+        dict(figure=figure, currentField=field)
+        for figure in FIGURES
+        for field in SQUARES
+    ]
+    validations = [dict(query, destField="D4") for query in moves]
+    return moves + validations
+
+
+def raise_open_files_limit() -> int:
+    # every connection is a file descriptor
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard != resource.RLIM_INFINITY and soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        soft = hard
+    return soft
+
+
+async def open_idle(url: str, count: int, concurrency: int) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def open_one():
+        async with semaphore:
+            return await websockets.connect(url, ping_interval=None)
+
+    connections = await asyncio.gather(
+        *(open_one() for _ in range(count)), return_exceptions=True
+    )
+    return [
+        connection
+        for connection in connections
+        if not isinstance(connection, Exception)
+    ]
+
+
+async def query_loop(
+    url: str, next_query, batch: int, deadline: float, samples: list, errors: list
+) -> None:
+    perf_counter_ns = time.perf_counter_ns
+    async with websockets.connect(url, ping_interval=None) as connection:
+        while time.monotonic() < deadline:
+            message = (
+                [next_query() for _ in range(batch)] if batch > 1 else next_query()
+            )
+            start = perf_counter_ns()
+            try:
+                await connection.send(json.dumps(message))
+                answer = json.loads(await connection.recv())
+            except websockets.ConnectionClosed:
+                errors.append(message)
+                return
+            samples.append(perf_counter_ns() - start)
+            # a list answer has results, a single answer has a status
+            if (
+                answer.get("status", 200) >= 500
+                or batch > 1
+                and "results" not in answer
+            ):
+                errors.append(message)
+
+
+async def alive(connections: list) -> int:
+    # idle connections still answering a query after the load phase
+    async def check(connection) -> bool:
+        try:
+            await connection.send(json.dumps(dict(figure="rook", currentField="H4")))
+            return json.loads(await connection.recv())["status"] == 200
+        except websockets.ConnectionClosed:
+            return False
+
+    results = await asyncio.gather(*(check(connection) for connection in connections))
+    await asyncio.gather(*(connection.close() for connection in connections))
+    return sum(results)
+
+
+async def run(args) -> dict:
+    started = time.monotonic()
+    idle = await open_idle(args.url, args.idle, args.connect_concurrency)
+    open_seconds = time.monotonic() - started
+
+    next_query = itertools.cycle(queries()).__next__
+    samples, errors = list(), list()
+    deadline = time.monotonic() + args.duration
+    started = time.monotonic()
+    await asyncio.gather(
+        *(
+            query_loop(args.url, next_query, args.batch, deadline, samples, errors)
+            for _ in range(args.active)
+        )
+    )
+    elapsed = time.monotonic() - started
+    return dict(
+        environment=environment(),
+        url=args.url,
+        open_files_limit=raise_open_files_limit(),
+        idle_requested=args.idle,
+        idle_opened=len(idle),
+        idle_open_s=open_seconds,
+        idle_alive=await alive(idle),
+        active=args.active,
+        batch=args.batch,
+        duration_s=elapsed,
+        messages=len(samples),
+        queries_per_sec=len(samples) * args.batch / elapsed,
+        errors=len(errors),
+        latency=summarize(samples) if samples else None,
+    )
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="WebSocket load test of the move API")
+    parser.add_argument("--url", default="ws://127.0.0.1:5000/api/v1/ws")
+    parser.add_argument(
+        "--idle", type=int, default=2000, help="idle connections held open"
+    )
+    parser.add_argument(
+        "--active", type=int, default=16, help="connections sending queries"
+    )
+    parser.add_argument("--batch", type=int, default=1, help="queries per message")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--connect-concurrency", type=int, default=200)
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args(argv)
+
+    raise_open_files_limit()
+    results = asyncio.run(run(args))
+    write_results(results, args.output)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import hashlib
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from threading import Lock
+
+from flask import Response, request
+
+from formats import ALL_FORMATS, ENCODERS, JSON, encode_json, negotiate
+from metrics import METRICS
+
+CachedResponse = namedtuple(
+    "CachedResponse", ["body", "status", "etag", "mimetype"], defaults=(JSON,)
+)
+
+
+class ResponseCache:
+    # bounded LRU of serialized responses keyed by request path
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> CachedResponse:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def serialize_response(
+    payload: dict, status: int, mimetype: str = JSON
+) -> CachedResponse:
+    with METRICS.stage("serialize"):
+        body = ENCODERS[mimetype](payload)
+        if body is None:
+            body, mimetype = encode_json(payload), JSON
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return CachedResponse(body, status, etag, mimetype)
+
+
+def cache_key(path: str, mimetype: str) -> str:
+    return path if mimetype == JSON else f"{path} {mimetype}"
+
+
+def cached_entry(
+    cache: ResponseCache, key: str, render, mimetype: str = JSON
+) -> CachedResponse:
+    # render is called on a miss and returns the (dict, status) response; only
+    # successful responses are kept, so requests for unknown figures or fields
+    # cannot evict the finite set of valid ones
+    entry = cache.get(key)
+    if entry is None:
+        entry = serialize_response(*render(), mimetype)
+        if 200 <= entry.status < 300:
+            cache.set(key, entry)
+    return entry
+
+
+def cached_response(cache: ResponseCache, max_age: int, formats: tuple = ALL_FORMATS):
+    # views must be pure functions of the request path returning (dict, status),
+    # the body is encoded in the format of formats the Accept header prefers
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            mimetype = negotiate(request.accept_mimetypes, formats)
+            entry = cached_entry(
+                cache,
+                cache_key(request.path, mimetype),
+                lambda: view(*args, **kwargs),
+                mimetype,
+            )
+
+            headers = {
+                "Cache-Control": f"public, max-age={max_age}",
+                "Vary": "Accept",
+            }
+            # only successful responses can be revalidated
+            if 200 <= entry.status < 300:
+                headers["ETag"] = f'"{entry.etag}"'
+                if request.if_none_match.contains(entry.etag):
+                    return Response(status=304, headers=headers)
+            return Response(
+                entry.body,
+                status=entry.status,
+                headers=headers,
+                mimetype=entry.mimetype,
+            )
+
+        return wrapper
+
+    return decorator
@@ -9,4 +9,20 @@ class FieldOutOfBoundsError(Error):
 
 
 class MoveNotPermittedError(Error):
-    """Raised when the move is not permitted"""
\ No newline at end of file
+    """Raised when the move is not permitted"""
+
+
+class InvalidPositionError(Error):
+    """Raised when the board position cannot be parsed"""
+
+
+class EmptyFieldError(Error):
+    """Raised when there is no figure on the field"""
+
+
+class InvalidNotationError(Error):
+    """Raised when a move in algebraic notation cannot be parsed"""
+
+
+class InvalidBoardError(Error):
+    """Raised when board dimensions are not supported"""
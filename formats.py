@@ -0,0 +1,137 @@
+import struct
+
+from flask import json
+
+from squares import SQUARE_INDEX
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+# number of squares followed by one square index byte each, in response order
+SQUARES_FORMAT = "application/vnd.chess.squares"
+# 64-bit big-endian mask with bit i set for square index i
+MASK_FORMAT = "application/vnd.chess.mask"
+
+ALL_FORMATS = (JSON, MSGPACK, SQUARES_FORMAT, MASK_FORMAT)
+# routes whose fields are not squares of the 8x8 board
+TEXT_FORMATS = (JSON, MSGPACK)
+
+VALIDATE_BYTES = {"valid": b"\x01", "invalid": b"\x00"}
+# MessagePack type code, struct format and exclusive limit of unsigned ints
+UNSIGNED_FORMATS = (
+    (0xCC, ">BB", 1 << 8),
+    (0xCD, ">BH", 1 << 16),
+    (0xCE, ">BI", 1 << 32),
+    (0xCF, ">BQ", 1 << 64),
+)
+
+
+def negotiate(accept, formats: tuple = ALL_FORMATS) -> str:
+    # accept is a werkzeug MIMEAccept, JSON wins ties and missing headers
+    return accept.best_match(formats, default=JSON) or JSON
+
+
+def encode_json(payload: dict) -> bytes:
+    return json.dumps(payload).encode("utf-8")
+
+
+def encode_msgpack(payload: dict) -> bytes:
+    body = bytearray()
+    pack(payload, body)
+    return bytes(body)
+
+
+def pack(value, body: bytearray) -> None:
+    # the MessagePack subset the responses need
+    if value is None:
+        body.append(0xC0)
+    elif value is True or value is False:
+        body.append(0xC3 if value else 0xC2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80:
+            body.append(value)
+        elif -0x20 <= value < 0:
+            body.append(value & 0xFF)
+        elif 0 <= value < 1 << 64:
+            for code, fmt, limit in UNSIGNED_FORMATS:
+                if value < limit:
+                    body += struct.pack(fmt, code, value)
+                    break
+        else:
+            body += struct.pack(">Bq", 0xD3, value)
+    elif isinstance(value, float):
+        body += struct.pack(">Bd", 0xCB, value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        if len(data) < 0x20:
+            body.append(0xA0 | len(data))
+        else:
+            pack_length(len(data), body, 0xD9, 0xDA, 0xDB)
+        body += data
+    elif isinstance(value, (list, tuple)):
+        if len(value) < 0x10:
+            body.append(0x90 | len(value))
+        else:
+            pack_length(len(value), body, None, 0xDC, 0xDD)
+        for item in value:
+            pack(item, body)
+    elif isinstance(value, dict):
+        if len(value) < 0x10:
+            body.append(0x80 | len(value))
+        else:
+            pack_length(len(value), body, None, 0xDE, 0xDF)
+        for key, item in value.items():
+            pack(key, body)
+            pack(item, body)
+    else:
+        raise TypeError(f"Cannot pack {type(value).__name__}")
+
+
+def pack_length(length: int, body: bytearray, code8, code16, code32) -> None:
+    if code8 is not None and length < 1 << 8:
+        body += struct.pack(">BB", code8, length)
+    elif length < 1 << 16:
+        body += struct.pack(">BH", code16, length)
+    else:
+        body += struct.pack(">BI", code32, length)
+
+
+def response_squares(payload: dict, keys: tuple) -> list:
+    # square indexes of the first field list of keys in payload, None for
+    # other responses and errors, which keep their message as JSON
+    for key in keys:
+        fields = payload.get(key)
+        if isinstance(fields, (list, tuple)) and payload.get("error") is None:
+            return [SQUARE_INDEX[field] for field in fields]
+    return None
+
+
+def encode_squares(payload: dict) -> bytes:
+    if "move" in payload:
+        return VALIDATE_BYTES.get(payload["move"])
+    squares = response_squares(payload, ("availableMoves", "path"))
+    if squares is None:
+        return None
+    return bytes([len(squares)] + squares)
+
+
+def encode_mask(payload: dict) -> bytes:
+    if "move" in payload:
+        return VALIDATE_BYTES.get(payload["move"])
+    # a path is ordered, so only move lists have a mask
+    squares = response_squares(payload, ("availableMoves",))
+    if squares is None:
+        return None
+    mask = 0
+    for square in squares:
+        mask |= 1 << square
+    return mask.to_bytes(8, "big")
+
+
+# encoders return None when the payload has no compact form, such responses
+# are sent as JSON
+ENCODERS = {
+    JSON: encode_json,
+    MSGPACK: encode_msgpack,
+    SQUARES_FORMAT: encode_squares,
+    MASK_FORMAT: encode_mask,
+}
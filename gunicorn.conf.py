@@ -0,0 +1,20 @@
+import multiprocessing
+import os
+
+# gunicorn -c gunicorn.conf.py wsgi:app
+# gunicorn -c gunicorn.conf.py -k uvicorn.workers.UvicornWorker asgi:application
+bind = os.environ.get("SERVER_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("SERVER_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.environ.get("SERVER_THREADS", 4))
+# sync workers close every connection, gthread and async workers keep them alive
+worker_class = os.environ.get("SERVER_WORKER_CLASS", "gthread")
+keepalive = int(os.environ.get("SERVER_KEEPALIVE", 5))
+timeout = int(os.environ.get("SERVER_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("SERVER_GRACEFUL_TIMEOUT", 30))
+max_requests = int(os.environ.get("SERVER_MAX_REQUESTS", 0))
+max_requests_jitter = int(os.environ.get("SERVER_MAX_REQUESTS_JITTER", 0))
+backlog = int(os.environ.get("SERVER_BACKLOG", 2048))
+# load the app and its move tables once in the master, workers share the pages
+preload_app = os.environ.get("SERVER_PRELOAD", "1") == "1"
+accesslog = os.environ.get("SERVER_ACCESS_LOG") or None
+errorlog = "-"
@@ -0,0 +1,177 @@
+import cProfile
+import io
+import pstats
+import random
+from bisect import bisect_left
+from contextlib import nullcontext
+from threading import Lock
+from time import perf_counter
+
+from settings import METRICS_ENABLED, PROFILE_SAMPLE_RATE
+
+# upper bounds of the latency histogram buckets in seconds
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+NULL_STAGE = nullcontext()
+
+
+class Histogram:
+    __slots__ = ("bucket_counts", "total", "count")
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class StageTimer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics: "Metrics", name: str):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.metrics.observe_stage(self.name, perf_counter() - self.start)
+
+
+class Metrics:
+    # per-stage timing counters and request latency histograms, every call is
+    # a no-op while disabled
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self._lock = Lock()
+        self._stages = dict()
+        self._requests = dict()
+
+    def stage(self, name: str):
+        if not self.enabled:
+            return NULL_STAGE
+        return StageTimer(self, name)
+
+    def observe_stage(self, name: str, seconds: float) -> None:
+        with self._lock:
+            calls, total = self._stages.get(name, (0, 0.0))
+            self._stages[name] = (calls + 1, total + seconds)
+
+    def observe_request(
+        self, endpoint: str, figure: str, status: int, seconds: float
+    ) -> None:
+        key = (endpoint, figure, str(status))
+        with self._lock:
+            histogram = self._requests.get(key)
+            if histogram is None:
+                histogram = self._requests[key] = Histogram()
+            histogram.observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._requests.clear()
+
+    def render(self) -> str:
+        # Prometheus text exposition format
+        lines = [
+            "# HELP chess_stage_seconds_total Time spent per request stage.",
+            "# TYPE chess_stage_seconds_total counter",
+        ]
+        with self._lock:
+            stages = sorted(self._stages.items())
+            requests = sorted(
+                (key, list(histogram.bucket_counts), histogram.total, histogram.count)
+                for key, histogram in self._requests.items()
+            )
+        for name, (calls, total) in stages:
+            lines.append(f'chess_stage_seconds_total{{stage="{name}"}} {total}')
+        lines.extend(
+            [
+                "# HELP chess_stage_calls_total Calls per request stage.",
+                "# TYPE chess_stage_calls_total counter",
+            ]
+        )
+        for name, (calls, total) in stages:
+            lines.append(f'chess_stage_calls_total{{stage="{name}"}} {calls}')
+        lines.extend(
+            [
+                "# HELP chess_request_duration_seconds Request latency.",
+                "# TYPE chess_request_duration_seconds histogram",
+            ]
+        )
+        for (endpoint, figure, status), bucket_counts, total, count in requests:
+            labels = f'endpoint="{endpoint}",figure="{figure}",status="{status}"'
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS, bucket_counts):
+                cumulative += bucket_count
+                lines.append(
+                    f"chess_request_duration_seconds_bucket"
+                    f'{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f'chess_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}'
+            )
+            lines.append(f"chess_request_duration_seconds_sum{{{labels}}} {total}")
+            lines.append(f"chess_request_duration_seconds_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+class SamplingProfiler:
+    # profiles a random sample_rate fraction of requests into one pstats report
+    def __init__(self, sample_rate: float):
+        self.sample_rate = sample_rate
+        self._lock = Lock()
+        self._stats = None
+
+    def start(self) -> cProfile.Profile:
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # another profiler is already active in this thread
+            return None
+        return profile
+
+    def stop(self, profile: cProfile.Profile) -> None:
+        profile.disable()
+        with self._lock:
+            if self._stats is None:
+                self._stats = pstats.Stats(profile)
+            else:
+                self._stats.add(profile)
+
+    def report(self, limit: int = 30) -> str:
+        with self._lock:
+            if self._stats is None:
+                return "No profiled requests.\n"
+            stream = io.StringIO()
+            self._stats.stream = stream
+            self._stats.sort_stats("cumulative").print_stats(limit)
+            return stream.getvalue()
+
+
+METRICS = Metrics(METRICS_ENABLED)
+PROFILER = SamplingProfiler(PROFILE_SAMPLE_RATE)
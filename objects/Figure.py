@@ -1,26 +1,34 @@
 from abc import ABC, abstractmethod
 
-import numpy as np
-
 from exceptions import MoveNotPermittedError
-from settings import CHESS_BOARD, CHESS_DIAGONALS, CHESS_CARDINALS, CHESS_DIMENSION
+from objects.move_table import MOVE_TABLE
+from settings import CHESS_DIAGONALS, CHESS_CARDINALS, CHESS_DIMENSION
+from squares import coordinates_to_field
 from utils import get_field_coordinates, is_in_bounds
 
 
 class Figure(ABC):
+    __slots__ = ("field",)
+
     def __init__(self, field: str):
         self.field = field
 
-    @abstractmethod
-    def list_available_moves(self):
-        pass
+    def list_available_moves(self) -> list:
+        return list(MOVE_TABLE.moves(type(self), self.field))
+
+    def validate_move(self, dest_field: str) -> None:
+        if not MOVE_TABLE.is_permitted(type(self), self.field, dest_field):
+            raise MoveNotPermittedError("Current move is not permitted.")
 
     @abstractmethod
-    def validate_move(self, dest_field):
+    def generate_moves(self) -> list:
+        # walks the empty board, results are cached in MOVE_TABLE
         pass
 
 
 class Context:
+    __slots__ = ("_strategy",)
+
     def __init__(self, strategy: Figure) -> None:
         self._strategy = strategy
 
@@ -33,23 +41,15 @@ class Context:
 
 
 class King(Figure):
-    def list_available_moves(self) -> list:
+    __slots__ = ()
+
+    def generate_moves(self) -> list:
         x, y = get_field_coordinates(self.field)
         available_moves = list()
         for x_position, y_position in self.__king_list(x, y):
             if is_in_bounds(x_position, y_position):
                 available_moves.append((x_position, y_position))
-        available_move_y_position = np.transpose(available_moves)[0]
-        available_move_x_position = np.transpose(available_moves)[1]
-        available_moves = CHESS_BOARD[
-            available_move_y_position, available_move_x_position
-        ]
-        return available_moves.tolist()
-
-    def validate_move(self, dest_field: str) -> None:
-        available_moves = self.list_available_moves()
-        if dest_field not in available_moves:
-            raise MoveNotPermittedError("Current move is not permitted.")
+        return [coordinates_to_field(x, y) for x, y in available_moves]
 
     def __king_list(self, x: int, y: int) -> list:
         return [
@@ -65,29 +65,19 @@ class King(Figure):
 
 
 class Pawn(Figure):
-    def list_available_moves(self) -> list:
+    __slots__ = ()
+
+    def generate_moves(self) -> list:
         x, y = get_field_coordinates(self.field)
-        field_name, field_number = self.__get_field_pole()
         if x == CHESS_DIMENSION[0]:
             return []
-        else:
-            new_field_number = field_number + 1
-        available_moves = [f"{field_name}{new_field_number}"]
-        return available_moves
-
-    def validate_move(self, dest_field: str) -> None:
-        valid_move = self.list_available_moves()
-        if dest_field not in valid_move:
-            raise MoveNotPermittedError("Current move is not permitted.")
-
-    def __get_field_pole(self) -> [str, int]:
-        field_number = int(self.field[1])
-        field_name = self.field[0]
-        return field_name, field_number
+        return [coordinates_to_field(x - 1, y)]
 
 
 class Queen(Figure):
-    def list_available_moves(self) -> list:
+    __slots__ = ()
+
+    def generate_moves(self) -> list:
         available_moves = list()
 
         x, y = get_field_coordinates(self.field)
@@ -98,23 +88,13 @@ class Queen(Figure):
                 available_moves.append((x_temp, y_temp))
 
                 x_temp, y_temp = x_temp + x_shift, y_temp + y_shift
-
-        available_move_y_position = np.transpose(available_moves)[0]
-        available_move_x_position = np.transpose(available_moves)[1]
-
-        available_moves = CHESS_BOARD[
-            available_move_y_position, available_move_x_position
-        ]
-        return available_moves.tolist()
-
-    def validate_move(self, dest_field: str) -> None:
-        available_moves = self.list_available_moves()
-        if dest_field not in available_moves:
-            raise MoveNotPermittedError("Current move is not permitted.")
+        return [coordinates_to_field(x, y) for x, y in available_moves]
 
 
 class Rook(Figure):
-    def list_available_moves(self) -> list:
+    __slots__ = ()
+
+    def generate_moves(self) -> list:
         available_moves = list()
 
         x, y = get_field_coordinates(self.field)
@@ -125,23 +105,13 @@ class Rook(Figure):
                 available_moves.append((x_temp, y_temp))
 
                 x_temp, y_temp = x_temp + x_shift, y_temp + y_shift
-
-        available_move_y_position = np.transpose(available_moves)[0]
-        available_move_x_position = np.transpose(available_moves)[1]
-
-        available_moves = CHESS_BOARD[
-            available_move_y_position, available_move_x_position
-        ]
-        return available_moves.tolist()
-
-    def validate_move(self, dest_field) -> None:
-        available_moves = self.list_available_moves()
-        if dest_field not in available_moves:
-            raise MoveNotPermittedError("Current move is not permitted.")
+        return [coordinates_to_field(x, y) for x, y in available_moves]
 
 
 class Bishop(Figure):
-    def list_available_moves(self) -> list:
+    __slots__ = ()
+
+    def generate_moves(self) -> list:
         available_moves = list()
         x, y = get_field_coordinates(self.field)
         for x_shift, y_shift in CHESS_DIAGONALS:
@@ -151,39 +121,19 @@ class Bishop(Figure):
                 available_moves.append((x_temp, y_temp))
 
                 x_temp, y_temp = x_temp + x_shift, y_temp + y_shift
-
-        available_move_y_position = np.transpose(available_moves)[0]
-        available_move_x_position = np.transpose(available_moves)[1]
-
-        available_moves = CHESS_BOARD[
-            available_move_y_position, available_move_x_position
-        ]
-        return available_moves.tolist()
-
-    def validate_move(self, dest_field) -> None:
-        available_moves = self.list_available_moves()
-        if dest_field not in available_moves:
-            raise MoveNotPermittedError("Current move is not permitted.")
+        return [coordinates_to_field(x, y) for x, y in available_moves]
 
 
 class Knight(Figure):
-    def list_available_moves(self) -> list:
+    __slots__ = ()
+
+    def generate_moves(self) -> list:
         x, y = get_field_coordinates(self.field)
         available_moves = list()
         for x_position, y_position in self.__knight_list(x, y, 2, 1):
             if is_in_bounds(x_position, y_position):
                 available_moves.append((x_position, y_position))
-        available_move_y_position = np.transpose(available_moves)[0]
-        available_move_x_position = np.transpose(available_moves)[1]
-        available_moves = CHESS_BOARD[
-            available_move_y_position, available_move_x_position
-        ]
-        return available_moves.tolist()
-
-    def validate_move(self, dest_field: str) -> None:
-        available_moves = self.list_available_moves()
-        if dest_field not in available_moves:
-            raise MoveNotPermittedError("Current move is not permitted.")
+        return [coordinates_to_field(x, y) for x, y in available_moves]
 
     def __knight_list(self, x: int, y: int, int1: int, int2: int) -> list:
 
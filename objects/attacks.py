@@ -0,0 +1,29 @@
+from exceptions import FieldOutOfBoundsError
+from objects.batch import stack_move_matrices, to_indexes
+from squares import BOARD_SIZE, SQUARES, SQUARE_INDEX
+
+
+def attack_map(figure_classes: dict, figures, fields):
+    # figure_classes maps figure names to classes, figures and fields describe
+    # the pieces; returns a BOARD_SIZE x BOARD_SIZE array counting how many
+    # pieces reach every field according to their move tables
+    import numpy as np
+
+    names = tuple(figure_classes)
+    matrices = stack_move_matrices(tuple(figure_classes[name] for name in names))
+    figure_indexes = to_indexes(figures, {name: i for i, name in enumerate(names)})
+    square_indexes = to_indexes(fields, SQUARE_INDEX)
+    if len(figure_indexes) != len(square_indexes):
+        raise ValueError("Figures and fields must have the same length.")
+    if (figure_indexes < 0).any():
+        raise ValueError("Figure does not exist.")
+    if (square_indexes < 0).any():
+        raise FieldOutOfBoundsError("Field does not exist.")
+
+    # count pieces per (figure, square) and sum their masks in one product
+    pieces = np.bincount(
+        figure_indexes * len(SQUARES) + square_indexes,
+        minlength=len(names) * len(SQUARES),
+    )
+    counts = pieces @ matrices.reshape(len(names) * len(SQUARES), len(SQUARES))
+    return counts.reshape(BOARD_SIZE, BOARD_SIZE)
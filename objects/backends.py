@@ -0,0 +1,34 @@
+from objects.Figure import Pawn, Rook, King, Knight, Queen, Bishop
+from objects.bitboard import (
+    BitboardPawn,
+    BitboardRook,
+    BitboardKing,
+    BitboardKnight,
+    BitboardQueen,
+    BitboardBishop,
+)
+
+FIGURE_BACKENDS = {
+    "table": {
+        "pawn": Pawn,
+        "rook": Rook,
+        "king": King,
+        "knight": Knight,
+        "queen": Queen,
+        "bishop": Bishop,
+    },
+    "bitboard": {
+        "pawn": BitboardPawn,
+        "rook": BitboardRook,
+        "king": BitboardKing,
+        "knight": BitboardKnight,
+        "queen": BitboardQueen,
+        "bishop": BitboardBishop,
+    },
+}
+
+
+def get_figure_classes(backend: str) -> dict:
+    if backend not in FIGURE_BACKENDS:
+        raise ValueError(f"Unknown figure backend: {backend}")
+    return FIGURE_BACKENDS[backend]
@@ -0,0 +1,82 @@
+from functools import lru_cache
+
+from objects.move_table import MOVE_TABLE
+from objects.results import (
+    VALID,
+    UNKNOWN_FIGURE,
+    FIELD_OUT_OF_BOUNDS,
+    MOVE_NOT_PERMITTED,
+)
+from squares import SQUARES, SQUARE_INDEX
+
+
+def list_moves_batch(queries: list) -> list:
+    # queries are (figure_class, field) pairs, each figure table is fetched once
+    # and every result is a list of moves or None when the field does not exist
+    tables = dict()
+    results = list()
+    for figure_class, field in queries:
+        table = tables.get(figure_class)
+        if table is None:
+            table = tables[figure_class] = MOVE_TABLE.table(figure_class)
+        moves = table.get(field)
+        results.append(None if moves is None else list(moves))
+    return results
+
+
+def validate_moves_batch(
+    figure_classes: dict, figures, current_fields, dest_fields
+) -> tuple:
+    # figure_classes maps figure names to classes, the remaining arguments are
+    # equally long sequences of figure names and fields forming the triples,
+    # returns boolean validity and error code arrays
+    import numpy as np
+
+    names = tuple(figure_classes)
+    matrices = stack_move_matrices(tuple(figure_classes[name] for name in names))
+    figure_index = {name: index for index, name in enumerate(names)}
+
+    figure_indexes = to_indexes(figures, figure_index)
+    current_indexes = to_indexes(current_fields, SQUARE_INDEX)
+    dest_indexes = to_indexes(dest_fields, SQUARE_INDEX)
+    if not len(figure_indexes) == len(current_indexes) == len(dest_indexes):
+        raise ValueError("Figures and fields must have the same length.")
+
+    known_figures = figure_indexes >= 0
+    known_currents = current_indexes >= 0
+    lookup = known_figures & known_currents & (dest_indexes >= 0)
+
+    valid = np.zeros(len(figure_indexes), dtype=bool)
+    valid[lookup] = matrices[
+        figure_indexes[lookup], current_indexes[lookup], dest_indexes[lookup]
+    ]
+    errors = np.full(len(figure_indexes), MOVE_NOT_PERMITTED, dtype=np.int8)
+    errors[valid] = VALID
+    errors[~known_currents] = FIELD_OUT_OF_BOUNDS
+    errors[~known_figures] = UNKNOWN_FIGURE
+    return valid, errors
+
+
+def move_matrix(figure_class: type):
+    # boolean (current square, destination square) matrix of permitted moves
+    import numpy as np
+
+    matrix = np.zeros((len(SQUARES), len(SQUARES)), dtype=bool)
+    for field, moves in MOVE_TABLE.table(figure_class).items():
+        matrix[SQUARE_INDEX[field], [SQUARE_INDEX[move] for move in moves]] = True
+    return matrix
+
+
+@lru_cache(maxsize=8)
+def stack_move_matrices(figure_classes: tuple):
+    import numpy as np
+
+    if not figure_classes:
+        return np.zeros((0, len(SQUARES), len(SQUARES)), dtype=bool)
+    return np.stack([move_matrix(figure_class) for figure_class in figure_classes])
+
+
+def to_indexes(values, index: dict):
+    import numpy as np
+
+    return np.fromiter((index.get(value, -1) for value in values), dtype=np.intp)
@@ -0,0 +1,88 @@
+from exceptions import FieldOutOfBoundsError, MoveNotPermittedError
+from objects.Figure import Figure, Pawn, Rook, King, Knight, Queen, Bishop
+from objects.move_table import MOVE_TABLE
+from squares import SQUARES
+
+# bit n of a mask is square index n, A8 is bit 0 and H1 is bit 63
+SQUARE_BITS = {field: 1 << index for index, field in enumerate(SQUARES)}
+
+
+def mask_to_fields(mask: int) -> list:
+    fields = list()
+    while mask:
+        lowest_bit = mask & -mask
+        fields.append(SQUARES[lowest_bit.bit_length() - 1])
+        mask ^= lowest_bit
+    return fields
+
+
+class AttackMasks:
+    # 64-bit destination mask of every figure on every square
+    def __init__(self):
+        self._masks = dict()
+
+    def mask(self, figure_class: type, field: str) -> int:
+        masks = self._masks.get(figure_class)
+        if masks is None:
+            masks = self._build(figure_class)
+        try:
+            return masks[field]
+        except KeyError:
+            raise FieldOutOfBoundsError("Field does not exist.")
+
+    def _build(self, figure_class: type) -> dict:
+        masks = dict()
+        for field in SQUARES:
+            mask = 0
+            for dest_field in MOVE_TABLE.moves(figure_class, field):
+                mask |= SQUARE_BITS[dest_field]
+            masks[field] = mask
+        self._masks[figure_class] = masks
+        return masks
+
+
+ATTACK_MASKS = AttackMasks()
+
+
+class BitboardFigure(Figure):
+    __slots__ = ()
+    move_class = Figure
+
+    # validates with a single mask test against the figure's attack mask
+    def validate_move(self, dest_field: str) -> None:
+        mask = ATTACK_MASKS.mask(self.move_class, self.field)
+        if not mask & SQUARE_BITS.get(dest_field, 0):
+            raise MoveNotPermittedError("Current move is not permitted.")
+
+    def list_available_moves(self) -> list:
+        return list(MOVE_TABLE.moves(self.move_class, self.field))
+
+
+class BitboardKing(BitboardFigure, King):
+    __slots__ = ()
+    move_class = King
+
+
+class BitboardPawn(BitboardFigure, Pawn):
+    __slots__ = ()
+    move_class = Pawn
+
+
+class BitboardQueen(BitboardFigure, Queen):
+    __slots__ = ()
+    move_class = Queen
+
+
+class BitboardRook(BitboardFigure, Rook):
+    __slots__ = ()
+    move_class = Rook
+
+
+class BitboardBishop(BitboardFigure, Bishop):
+    __slots__ = ()
+    move_class = Bishop
+
+
+class BitboardKnight(BitboardFigure, Knight):
+    __slots__ = ()
+    move_class = Knight
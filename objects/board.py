@@ -0,0 +1,515 @@
+import random
+from collections import namedtuple
+
+from exceptions import (
+    EmptyFieldError,
+    InvalidPositionError,
+    MoveNotPermittedError,
+)
+from objects.Figure import Figure, King, Knight
+from objects.move_table import MOVE_TABLE
+from settings import CHESS_DIAGONALS, CHESS_CARDINALS
+from squares import (
+    BOARD_SIZE,
+    SQUARES,
+    SQUARE_INDEX,
+    SQUARE_COORDINATES,
+    field_to_index,
+)
+from utils import is_in_bounds
+
+WHITE = "w"
+BLACK = "b"
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+PIECE_NAMES = {
+    "p": "pawn",
+    "n": "knight",
+    "b": "bishop",
+    "r": "rook",
+    "q": "queen",
+    "k": "king",
+}
+PROMOTIONS = ("q", "r", "b", "n")
+
+# castling right -> king from, king to, rook from, rook to, fields that must be
+# empty and fields that must not be attacked
+CASTLING = {
+    "K": (60, 62, 63, 61, (61, 62), (60, 61, 62)),
+    "Q": (60, 58, 56, 59, (59, 58, 57), (60, 59, 58)),
+    "k": (4, 6, 7, 5, (5, 6), (4, 5, 6)),
+    "q": (4, 2, 0, 3, (3, 2, 1), (4, 3, 2)),
+}
+
+# king from and to field of a castling move -> rook from and to field
+CASTLING_ROOKS = {
+    (king_from, king_to): (rook_from, rook_to)
+    for king_from, king_to, rook_from, rook_to, _, _ in CASTLING.values()
+}
+# castling rights lost when a piece leaves or lands on the field
+CASTLING_RIGHTS_LOST = {60: "KQ", 63: "K", 56: "Q", 4: "kq", 7: "k", 0: "q"}
+
+Move = namedtuple("Move", ["from_index", "to_index", "promotion"])
+
+
+def _build_rays(direction: tuple) -> tuple:
+    rays = list()
+    for x, y in SQUARE_COORDINATES:
+        ray = list()
+        x_temp, y_temp = x + direction[0], y + direction[1]
+        while is_in_bounds(x_temp, y_temp):
+            ray.append(x_temp * BOARD_SIZE + y_temp)
+            x_temp, y_temp = x_temp + direction[0], y_temp + direction[1]
+        rays.append(tuple(ray))
+    return tuple(rays)
+
+
+def _build_pawn_attacks(x_shift: int) -> tuple:
+    attacks = list()
+    for x, y in SQUARE_COORDINATES:
+        attacks.append(
+            tuple(
+                (x + x_shift) * BOARD_SIZE + y + y_shift
+                for y_shift in (-1, 1)
+                if is_in_bounds(x + x_shift, y + y_shift)
+            )
+        )
+    return tuple(attacks)
+
+
+def _build_targets(figure_class: type) -> tuple:
+    return tuple(
+        tuple(SQUARE_INDEX[move] for move in MOVE_TABLE.moves(figure_class, field))
+        for field in SQUARES
+    )
+
+
+# precomputed per-square tables, rays run from the square towards the edge
+RAYS = {
+    direction: _build_rays(direction) for direction in CHESS_DIAGONALS + CHESS_CARDINALS
+}
+KNIGHT_TARGETS = _build_targets(Knight)
+KING_TARGETS = _build_targets(King)
+# white pawns move towards rank 8, which is row 0 of CHESS_BOARD
+PAWN_ATTACKS = {WHITE: _build_pawn_attacks(-1), BLACK: _build_pawn_attacks(1)}
+PAWN_PUSH = {WHITE: -BOARD_SIZE, BLACK: BOARD_SIZE}
+PAWN_START_ROW = {WHITE: BOARD_SIZE - 2, BLACK: 1}
+PAWN_PROMOTION_ROW = {WHITE: 0, BLACK: BOARD_SIZE - 1}
+# row of the en passant field when the side moves, behind an enemy double push
+EN_PASSANT_ROW = {WHITE: 2, BLACK: BOARD_SIZE - 3}
+SLIDING_DIRECTIONS = {
+    "b": CHESS_DIAGONALS,
+    "r": CHESS_CARDINALS,
+    "q": CHESS_DIAGONALS + CHESS_CARDINALS,
+}
+
+
+# fixed seed keeps hashes identical across processes and runs
+_zobrist_random = random.Random(0x5EED)
+ZOBRIST_PIECES = {
+    piece: tuple(_zobrist_random.getrandbits(64) for _ in SQUARES)
+    for piece in "PNBRQKpnbrqk"
+}
+ZOBRIST_CASTLING = {right: _zobrist_random.getrandbits(64) for right in CASTLING}
+ZOBRIST_EN_PASSANT = tuple(_zobrist_random.getrandbits(64) for _ in range(BOARD_SIZE))
+ZOBRIST_BLACK = _zobrist_random.getrandbits(64)
+
+
+def color_of(piece: str) -> str:
+    return WHITE if piece.isupper() else BLACK
+
+
+def opponent(color: str) -> str:
+    return BLACK if color == WHITE else WHITE
+
+
+class Board:
+    def __init__(
+        self,
+        squares: list,
+        side_to_move: str = WHITE,
+        castling: str = "",
+        en_passant: int = None,
+        halfmove_clock: int = 0,
+        fullmove_number: int = 1,
+    ):
+        self.squares = squares
+        self.side_to_move = side_to_move
+        self.castling = castling
+        self.en_passant = en_passant
+        self.halfmove_clock = halfmove_clock
+        self.fullmove_number = fullmove_number
+        self.hash = self.compute_hash()
+        self._undo = list()
+
+    @classmethod
+    def from_fen(cls, fen: str) -> "Board":
+        parts = fen.split() if isinstance(fen, str) else []
+        if not 4 <= len(parts) <= 6:
+            raise InvalidPositionError("Position is not a valid FEN.")
+        placement, side_to_move, castling, en_passant = parts[:4]
+
+        squares = list()
+        ranks = placement.split("/")
+        if len(ranks) != BOARD_SIZE:
+            raise InvalidPositionError("Position is not a valid FEN.")
+        for rank in ranks:
+            rank_squares = list()
+            for char in rank:
+                if char in "12345678":
+                    rank_squares.extend([None] * int(char))
+                elif char.lower() in PIECE_NAMES:
+                    rank_squares.append(char)
+                else:
+                    raise InvalidPositionError("Position is not a valid FEN.")
+            if len(rank_squares) != BOARD_SIZE:
+                raise InvalidPositionError("Position is not a valid FEN.")
+            squares.extend(rank_squares)
+
+        if side_to_move not in (WHITE, BLACK):
+            raise InvalidPositionError("Position is not a valid FEN.")
+        if castling == "-":
+            castling = ""
+        if any(right not in CASTLING for right in castling):
+            raise InvalidPositionError("Position is not a valid FEN.")
+        if en_passant == "-":
+            en_passant = None
+        elif en_passant.upper() in SQUARE_INDEX:
+            en_passant = SQUARE_INDEX[en_passant.upper()]
+            # the field must be empty, right behind the pawn that just moved
+            enemy_pawn = "p" if side_to_move == WHITE else "P"
+            if (
+                en_passant // BOARD_SIZE != EN_PASSANT_ROW[side_to_move]
+                or squares[en_passant] is not None
+                or squares[en_passant - PAWN_PUSH[side_to_move]] != enemy_pawn
+            ):
+                raise InvalidPositionError("Position is not a valid FEN.")
+        else:
+            raise InvalidPositionError("Position is not a valid FEN.")
+        # clocks are plain ASCII counts, int() would take signs and other digits
+        if not all(clock.isascii() and clock.isdecimal() for clock in parts[4:]):
+            raise InvalidPositionError("Position is not a valid FEN.")
+        clocks = [int(clock) for clock in parts[4:]]
+        return cls(squares, side_to_move, castling, en_passant, *clocks)
+
+    def to_fen(self) -> str:
+        ranks = list()
+        for row in range(BOARD_SIZE):
+            rank, empty = "", 0
+            for piece in self.squares[row * BOARD_SIZE : (row + 1) * BOARD_SIZE]:
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    rank, empty = rank + str(empty), 0
+                rank += piece
+            ranks.append(rank + (str(empty) if empty else ""))
+        en_passant = (
+            "-" if self.en_passant is None else SQUARES[self.en_passant].lower()
+        )
+        return " ".join(
+            [
+                "/".join(ranks),
+                self.side_to_move,
+                self.castling or "-",
+                en_passant,
+                str(self.halfmove_clock),
+                str(self.fullmove_number),
+            ]
+        )
+
+    def compute_hash(self) -> int:
+        # 64-bit Zobrist hash of placement, side, castling and en passant file
+        hash_value = ZOBRIST_BLACK if self.side_to_move == BLACK else 0
+        for index, piece in enumerate(self.squares):
+            if piece is not None:
+                hash_value ^= ZOBRIST_PIECES[piece][index]
+        for right in self.castling:
+            hash_value ^= ZOBRIST_CASTLING[right]
+        if self.en_passant is not None:
+            hash_value ^= ZOBRIST_EN_PASSANT[self.en_passant % BOARD_SIZE]
+        return hash_value
+
+    def make_move(self, move: Move) -> None:
+        # applies the move in place, the hash is updated incrementally
+        squares = self.squares
+        color = self.side_to_move
+        piece = squares[move.from_index]
+        is_pawn = piece == "P" or piece == "p"
+        captured_index = move.to_index
+        if is_pawn and move.to_index == self.en_passant:
+            captured_index = move.to_index - PAWN_PUSH[color]
+        captured = squares[captured_index]
+        self._undo.append(
+            (
+                move,
+                captured,
+                captured_index,
+                self.castling,
+                self.en_passant,
+                self.halfmove_clock,
+                self.hash,
+            )
+        )
+
+        hash_value = self.hash ^ ZOBRIST_BLACK
+        hash_value ^= ZOBRIST_PIECES[piece][move.from_index]
+        if captured is not None:
+            squares[captured_index] = None
+            hash_value ^= ZOBRIST_PIECES[captured][captured_index]
+        placed = piece
+        if move.promotion is not None:
+            placed = move.promotion.upper() if color == WHITE else move.promotion
+        squares[move.from_index] = None
+        squares[move.to_index] = placed
+        hash_value ^= ZOBRIST_PIECES[placed][move.to_index]
+
+        if piece == "K" or piece == "k":
+            rook_move = CASTLING_ROOKS.get((move.from_index, move.to_index))
+            if rook_move is not None:
+                rook_from, rook_to = rook_move
+                rook = squares[rook_from]
+                squares[rook_from], squares[rook_to] = None, rook
+                hash_value ^= ZOBRIST_PIECES[rook][rook_from]
+                hash_value ^= ZOBRIST_PIECES[rook][rook_to]
+
+        if self.castling:
+            lost = CASTLING_RIGHTS_LOST.get(move.from_index, "")
+            lost += CASTLING_RIGHTS_LOST.get(move.to_index, "")
+            for right in lost:
+                if right in self.castling:
+                    self.castling = self.castling.replace(right, "")
+                    hash_value ^= ZOBRIST_CASTLING[right]
+
+        if self.en_passant is not None:
+            hash_value ^= ZOBRIST_EN_PASSANT[self.en_passant % BOARD_SIZE]
+            self.en_passant = None
+        if is_pawn and abs(move.to_index - move.from_index) == 2 * BOARD_SIZE:
+            self.en_passant = (move.from_index + move.to_index) // 2
+            hash_value ^= ZOBRIST_EN_PASSANT[self.en_passant % BOARD_SIZE]
+
+        if is_pawn or captured is not None:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if color == BLACK:
+            self.fullmove_number += 1
+        self.side_to_move = opponent(color)
+        self.hash = hash_value
+
+    def unmake_move(self) -> Move:
+        # reverts the last make_move and returns the reverted move
+        (
+            move,
+            captured,
+            captured_index,
+            self.castling,
+            self.en_passant,
+            self.halfmove_clock,
+            self.hash,
+        ) = self._undo.pop()
+        squares = self.squares
+        color = self.side_to_move = opponent(self.side_to_move)
+        piece = squares[move.to_index]
+        if move.promotion is not None:
+            piece = "P" if color == WHITE else "p"
+        squares[move.to_index] = None
+        squares[move.from_index] = piece
+        if captured is not None:
+            squares[captured_index] = captured
+
+        if piece == "K" or piece == "k":
+            rook_move = CASTLING_ROOKS.get((move.from_index, move.to_index))
+            if rook_move is not None:
+                rook_from, rook_to = rook_move
+                squares[rook_from], squares[rook_to] = squares[rook_to], None
+        if color == BLACK:
+            self.fullmove_number -= 1
+        return move
+
+    def piece_at(self, field: str) -> str:
+        return self.squares[field_to_index(field)]
+
+    def is_attacked(self, index: int, by_color: str) -> bool:
+        squares = self.squares
+        pawn, knight, king = ("P", "N", "K") if by_color == WHITE else ("p", "n", "k")
+        bishop, rook, queen = ("B", "R", "Q") if by_color == WHITE else ("b", "r", "q")
+
+        for target in PAWN_ATTACKS[opponent(by_color)][index]:
+            if squares[target] == pawn:
+                return True
+        for target in KNIGHT_TARGETS[index]:
+            if squares[target] == knight:
+                return True
+        for target in KING_TARGETS[index]:
+            if squares[target] == king:
+                return True
+        for directions, slider in ((CHESS_DIAGONALS, bishop), (CHESS_CARDINALS, rook)):
+            for direction in directions:
+                for target in RAYS[direction][index]:
+                    piece = squares[target]
+                    if piece is None:
+                        continue
+                    if piece == slider or piece == queen:
+                        return True
+                    break
+        return False
+
+    def attackers(self, index: int, by_color: str) -> list:
+        squares = self.squares
+        pawn, knight, king = ("P", "N", "K") if by_color == WHITE else ("p", "n", "k")
+        bishop, rook, queen = ("B", "R", "Q") if by_color == WHITE else ("b", "r", "q")
+
+        attackers = [
+            target
+            for target in PAWN_ATTACKS[opponent(by_color)][index]
+            if squares[target] == pawn
+        ]
+        attackers.extend(
+            target for target in KNIGHT_TARGETS[index] if squares[target] == knight
+        )
+        attackers.extend(
+            target for target in KING_TARGETS[index] if squares[target] == king
+        )
+        for directions, slider in ((CHESS_DIAGONALS, bishop), (CHESS_CARDINALS, rook)):
+            for direction in directions:
+                for target in RAYS[direction][index]:
+                    piece = squares[target]
+                    if piece is None:
+                        continue
+                    if piece == slider or piece == queen:
+                        attackers.append(target)
+                    break
+        return attackers
+
+    def king_index(self, color: str) -> int:
+        king = "K" if color == WHITE else "k"
+        try:
+            return self.squares.index(king)
+        except ValueError:
+            return None
+
+    def generate_moves(self) -> list:
+        # pseudo-legal moves of the side to move
+        moves = list()
+        for index, piece in enumerate(self.squares):
+            if piece is not None and color_of(piece) == self.side_to_move:
+                moves.extend(self.piece_moves(index))
+        return moves
+
+    def piece_moves(self, index: int) -> list:
+        piece = self.squares[index]
+        if piece is None:
+            return []
+        color = color_of(piece)
+        kind = piece.lower()
+        if kind == "p":
+            return self._pawn_moves(index, color)
+        if kind == "n":
+            return self._step_moves(index, color, KNIGHT_TARGETS[index])
+        if kind == "k":
+            moves = self._step_moves(index, color, KING_TARGETS[index])
+            moves.extend(self._castling_moves(index, color))
+            return moves
+        return self._sliding_moves(index, color, SLIDING_DIRECTIONS[kind])
+
+    def moves_from(self, field: str) -> list:
+        index = field_to_index(field)
+        if self.squares[index] is None:
+            raise EmptyFieldError("Field is empty.")
+        destinations = list()
+        for move in self.piece_moves(index):
+            dest_field = SQUARES[move.to_index]
+            if dest_field not in destinations:
+                destinations.append(dest_field)
+        return destinations
+
+    def _step_moves(self, index: int, color: str, targets: tuple) -> list:
+        moves = list()
+        for target in targets:
+            piece = self.squares[target]
+            if piece is None or color_of(piece) != color:
+                moves.append(Move(index, target, None))
+        return moves
+
+    def _sliding_moves(self, index: int, color: str, directions: list) -> list:
+        moves = list()
+        for direction in directions:
+            for target in RAYS[direction][index]:
+                piece = self.squares[target]
+                if piece is None:
+                    moves.append(Move(index, target, None))
+                    continue
+                if color_of(piece) != color:
+                    moves.append(Move(index, target, None))
+                break
+        return moves
+
+    def _pawn_moves(self, index: int, color: str) -> list:
+        squares = self.squares
+        targets = list()
+        push = index + PAWN_PUSH[color]
+        if 0 <= push < len(squares) and squares[push] is None:
+            targets.append(push)
+            double_push = push + PAWN_PUSH[color]
+            if (
+                SQUARE_COORDINATES[index][0] == PAWN_START_ROW[color]
+                and squares[double_push] is None
+            ):
+                targets.append(double_push)
+        for target in PAWN_ATTACKS[color][index]:
+            piece = squares[target]
+            if piece is not None and color_of(piece) != color:
+                targets.append(target)
+            elif target == self.en_passant and color == self.side_to_move:
+                targets.append(target)
+
+        moves = list()
+        for target in targets:
+            if SQUARE_COORDINATES[target][0] == PAWN_PROMOTION_ROW[color]:
+                moves.extend(Move(index, target, promotion) for promotion in PROMOTIONS)
+            else:
+                moves.append(Move(index, target, None))
+        return moves
+
+    def _castling_moves(self, index: int, color: str) -> list:
+        moves = list()
+        if color != self.side_to_move:
+            return moves
+        for right in self.castling:
+            if (right.isupper()) != (color == WHITE):
+                continue
+            king_from, king_to, rook_from, _, empty, safe = CASTLING[right]
+            rook = "R" if color == WHITE else "r"
+            if index != king_from or self.squares[rook_from] != rook:
+                continue
+            if any(self.squares[field] is not None for field in empty):
+                continue
+            if any(self.is_attacked(field, opponent(color)) for field in safe):
+                continue
+            moves.append(Move(index, king_to, None))
+        return moves
+
+
+class PositionFigure(Figure):
+    # strategy for Context answering for the figure standing on a Board
+    __slots__ = ("board",)
+
+    def __init__(self, field: str, board: Board):
+        super().__init__(field)
+        self.board = board
+
+    def generate_moves(self) -> list:
+        return self.board.moves_from(self.field)
+
+    def list_available_moves(self) -> list:
+        return self.generate_moves()
+
+    def validate_move(self, dest_field: str) -> None:
+        if dest_field not in self.generate_moves():
+            raise MoveNotPermittedError("Current move is not permitted.")
+
+    @property
+    def figure_name(self) -> str:
+        piece = self.board.piece_at(self.field)
+        return None if piece is None else PIECE_NAMES[piece.lower()]
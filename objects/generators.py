@@ -0,0 +1,85 @@
+from objects.bitboard import ATTACK_MASKS, BitboardFigure
+from objects.move_table import MOVE_TABLE
+from objects.results import (
+    FIELD_OUT_OF_BOUNDS_RESULT,
+    MOVE_NOT_PERMITTED_RESULT,
+    VALID,
+    VALID_MOVE_RESULT,
+    MoveResult,
+)
+from squares import FIELD_SQUARES, SQUARES
+
+
+class MoveGenerator:
+    # stateless flyweight answering the moves of one figure type, shared by
+    # every request instead of building a Figure and a Context per call;
+    # bitboard figures validate with a mask test, table figures with a set
+    # lookup, as their Figure classes do
+    __slots__ = ("figure_class", "_moves", "_masks", "_destinations", "_results")
+
+    def __init__(self, figure_class: type):
+        self.figure_class = figure_class
+        table = MOVE_TABLE.table(figure_class)
+        self._moves = tuple(table[field] for field in SQUARES)
+        self._masks = None
+        self._destinations = None
+        if issubclass(figure_class, BitboardFigure):
+            self._masks = tuple(
+                ATTACK_MASKS.mask(figure_class.move_class, field) for field in SQUARES
+            )
+        else:
+            self._destinations = tuple(
+                frozenset(FIELD_SQUARES[move] for move in moves)
+                for moves in self._moves
+            )
+        self._results = tuple(MoveResult(True, moves, VALID) for moves in self._moves)
+
+    def moves(self, square: int) -> tuple:
+        # square must be a valid index, e.g. a squares.Square
+        return self._moves[square]
+
+    def is_permitted(self, square: int, dest_square: int) -> bool:
+        if self._masks is None:
+            return dest_square in self._destinations[square]
+        return self._masks[square] >> dest_square & 1 == 1
+
+    def moves_result(self, square: int) -> MoveResult:
+        # square is a Square or None for a field that does not exist
+        if square is None:
+            return FIELD_OUT_OF_BOUNDS_RESULT
+        return self._results[square]
+
+    def validate_result(self, square: int, dest_square: int) -> MoveResult:
+        if square is None:
+            return FIELD_OUT_OF_BOUNDS_RESULT
+        if dest_square is None or not self.is_permitted(square, dest_square):
+            return MOVE_NOT_PERMITTED_RESULT
+        return VALID_MOVE_RESULT
+
+    def list_moves(self, field: str) -> tuple:
+        result = self.moves_result(FIELD_SQUARES.get(field))
+        result.raise_for_error()
+        return result.moves
+
+    def validate_move(self, field: str, dest_field: str) -> None:
+        result = self.validate_result(
+            FIELD_SQUARES.get(field), FIELD_SQUARES.get(dest_field)
+        )
+        result.raise_for_error()
+
+
+_MOVE_GENERATORS = dict()
+
+
+def get_move_generator(figure_class: type) -> MoveGenerator:
+    generator = _MOVE_GENERATORS.get(figure_class)
+    if generator is None:
+        generator = _MOVE_GENERATORS[figure_class] = MoveGenerator(figure_class)
+    return generator
+
+
+def get_move_generators(figure_classes: dict) -> dict:
+    return {
+        name: get_move_generator(figure_class)
+        for name, figure_class in figure_classes.items()
+    }
@@ -0,0 +1,115 @@
+from functools import lru_cache
+from string import ascii_uppercase
+
+from exceptions import FieldOutOfBoundsError, InvalidBoardError
+from settings import CHESS_DIAGONALS, CHESS_CARDINALS
+
+MAX_DIMENSION = len(ascii_uppercase)
+
+# figure name -> (x, y) shifts in the order the 8x8 figures walk them and
+# whether the figure slides along them
+FIGURE_SHIFTS = {
+    "king": (
+        [(1, 0), (1, 1), (1, -1), (0, 1), (0, -1), (-1, 0), (-1, 1), (-1, -1)],
+        False,
+    ),
+    "pawn": ([(-1, 0)], False),
+    "queen": (CHESS_DIAGONALS + CHESS_CARDINALS, True),
+    "rook": (CHESS_CARDINALS, True),
+    "bishop": (CHESS_DIAGONALS, True),
+    "knight": (
+        [(2, 1), (-2, 1), (2, -1), (-2, -1), (1, 2), (-1, 2), (1, -2), (-1, -2)],
+        False,
+    ),
+}
+
+
+class BoardGeometry:
+    # columns x rows empty board, columns are named A, B, ... and rows 1, 2, ...
+    # from the bottom; like CHESS_BOARD the fields are indexed row by row from
+    # the top left, so the 8x8 geometry has A8 at 0 and H1 at 63
+    def __init__(self, columns: int, rows: int):
+        if not (1 <= columns <= MAX_DIMENSION and 1 <= rows <= MAX_DIMENSION):
+            raise InvalidBoardError("Board dimensions are not supported.")
+        self.columns = columns
+        self.rows = rows
+        self.fields = tuple(
+            f"{ascii_uppercase[column]}{rows - row}"
+            for row in range(rows)
+            for column in range(columns)
+        )
+        self.field_index = {field: index for index, field in enumerate(self.fields)}
+        self._tables = dict()
+
+    def field_to_index(self, field: str) -> int:
+        try:
+            return self.field_index[field]
+        except (KeyError, TypeError):
+            raise FieldOutOfBoundsError("Field does not exist.")
+
+    def moves(self, figure: str, field: str) -> list:
+        destinations, offsets = self.table(figure)
+        index = self.field_to_index(field)
+        fields = self.fields
+        return [
+            fields[dest]
+            for dest in destinations[offsets[index] : offsets[index + 1]].tolist()
+        ]
+
+    def is_permitted(self, figure: str, field: str, dest_field: str) -> bool:
+        destinations, offsets = self.table(figure)
+        index = self.field_to_index(field)
+        dest_index = self.field_index.get(dest_field)
+        if dest_index is None:
+            return False
+        moves = destinations[offsets[index] : offsets[index + 1]]
+        return bool((moves == dest_index).any())
+
+    def table(self, figure: str) -> tuple:
+        # destinations of every field concatenated and the offset of each
+        # field's slice, the destinations of field i are [offsets[i], offsets[i+1])
+        table = self._tables.get(figure)
+        if table is None:
+            table = self._tables[figure] = self._build(*FIGURE_SHIFTS[figure])
+        return table
+
+    def _build(self, shifts: list, sliding: bool) -> tuple:
+        # every field, shift and distance at once: (fields, shifts, distances)
+        import numpy as np
+
+        rows, columns = np.divmod(np.arange(len(self.fields)), self.columns)
+        shifts = np.array(shifts)
+        distances = np.arange(1, max(self.rows, self.columns) if sliding else 2)
+        target_rows = (
+            rows[:, None, None] + shifts[None, :, 0, None] * distances[None, None, :]
+        )
+        target_columns = (
+            columns[:, None, None] + shifts[None, :, 1, None] * distances[None, None, :]
+        )
+        # rays leave the board for good, so in bounds targets are contiguous
+        in_bounds = (
+            (target_rows >= 0)
+            & (target_rows < self.rows)
+            & (target_columns >= 0)
+            & (target_columns < self.columns)
+        )
+        targets = target_rows * self.columns + target_columns
+        destinations = targets[in_bounds].astype(np.int32)
+        offsets = np.zeros(len(self.fields) + 1, dtype=np.intp)
+        np.cumsum(in_bounds.sum(axis=(1, 2)), out=offsets[1:])
+        return destinations, offsets
+
+
+@lru_cache(maxsize=16)
+def get_board_geometry(columns: int, rows: int) -> BoardGeometry:
+    return BoardGeometry(columns, rows)
+
+
+def parse_dimensions(dimensions: str) -> (int, int):
+    # "16x16" -> (16, 16)
+    columns, separator, rows = dimensions.lower().partition("x")
+    if not separator or not all(
+        value.isascii() and value.isdecimal() for value in (columns, rows)
+    ):
+        raise InvalidBoardError("Board dimensions are not supported.")
+    return int(columns), int(rows)
@@ -0,0 +1,151 @@
+from exceptions import EmptyFieldError
+from objects.board import (
+    RAYS,
+    PAWN_PUSH,
+    Board,
+    Move,
+    PositionFigure,
+    color_of,
+    opponent,
+    WHITE,
+)
+from settings import CHESS_DIAGONALS, CHESS_CARDINALS
+from squares import SQUARES, field_to_index
+
+
+def _build_between() -> dict:
+    # source * 64 + target -> fields strictly between two aligned fields
+    between = dict()
+    for rays in RAYS.values():
+        for source, ray in enumerate(rays):
+            for distance, target in enumerate(ray):
+                between[source * len(SQUARES) + target] = frozenset(ray[:distance])
+    return between
+
+
+BETWEEN = _build_between()
+
+
+class LegalMoveFilter:
+    # checkers and pin rays of the side to move are computed once per position,
+    # then each pseudo-legal move is accepted or rejected without replaying it
+    __slots__ = ("board", "color", "king", "checkers", "pins", "check_targets")
+
+    def __init__(self, board: Board):
+        self.board = board
+        self.color = board.side_to_move
+        self.king = board.king_index(self.color)
+        self.checkers = list()
+        self.pins = dict()
+        self.check_targets = None
+        if self.king is None:
+            return
+        self.checkers = board.attackers(self.king, opponent(self.color))
+        self.pins = self._find_pins()
+        if len(self.checkers) == 1:
+            checker = self.checkers[0]
+            self.check_targets = BETWEEN.get(
+                self.king * len(SQUARES) + checker, frozenset()
+            ) | {checker}
+
+    @property
+    def in_check(self) -> bool:
+        return len(self.checkers) > 0
+
+    def is_legal(self, move: Move) -> bool:
+        if move.from_index == self.king:
+            return self._king_is_safe_on(move.to_index)
+        if len(self.checkers) > 1:
+            return False
+        squares = self.board.squares
+        if (
+            move.to_index == self.board.en_passant
+            and squares[move.to_index] is None
+            and squares[move.from_index].lower() == "p"
+        ):
+            return self._en_passant_is_safe(move)
+        pin = self.pins.get(move.from_index)
+        if pin is not None and move.to_index not in pin:
+            return False
+        if self.check_targets is not None and move.to_index not in self.check_targets:
+            return False
+        return True
+
+    def legal_moves(self) -> list:
+        return [move for move in self.board.generate_moves() if self.is_legal(move)]
+
+    def _find_pins(self) -> dict:
+        # own piece -> fields it may move to without exposing the king
+        squares = self.board.squares
+        enemy_sliders = (
+            (CHESS_DIAGONALS, "bq" if self.color == WHITE else "BQ"),
+            (CHESS_CARDINALS, "rq" if self.color == WHITE else "RQ"),
+        )
+        pins = dict()
+        for directions, sliders in enemy_sliders:
+            for direction in directions:
+                candidate = None
+                for target in RAYS[direction][self.king]:
+                    piece = squares[target]
+                    if piece is None:
+                        continue
+                    if candidate is None and color_of(piece) == self.color:
+                        candidate = target
+                        continue
+                    if candidate is not None and piece in sliders:
+                        between = BETWEEN[self.king * len(SQUARES) + target]
+                        pins[candidate] = between | {target}
+                    break
+        return pins
+
+    def _king_is_safe_on(self, index: int) -> bool:
+        # the king is lifted so sliders attacking through its field count
+        squares = self.board.squares
+        king = squares[self.king]
+        squares[self.king] = None
+        try:
+            return not self.board.is_attacked(index, opponent(self.color))
+        finally:
+            squares[self.king] = king
+
+    def _en_passant_is_safe(self, move: Move) -> bool:
+        # two pawns leave the king's rank at once, so replay it on a copy
+        if self.king is None:
+            return True
+        squares = list(self.board.squares)
+        squares[move.to_index] = squares[move.from_index]
+        squares[move.from_index] = None
+        squares[move.to_index - PAWN_PUSH[self.color]] = None
+        board = Board(squares, self.color)
+        return not board.is_attacked(self.king, opponent(self.color))
+
+
+def legal_moves(board: Board) -> list:
+    return LegalMoveFilter(board).legal_moves()
+
+
+def legal_moves_from(board: Board, field: str) -> list:
+    # legal destinations of the figure on field, a figure of the side not to
+    # move is answered as if it were its turn
+    index = field_to_index(field)
+    piece = board.squares[index]
+    if piece is None:
+        raise EmptyFieldError("Field is empty.")
+    color = color_of(piece)
+    if color != board.side_to_move:
+        board = Board(board.squares, color, board.castling, None)
+    move_filter = LegalMoveFilter(board)
+    destinations = list()
+    for move in board.piece_moves(index):
+        dest_field = SQUARES[move.to_index]
+        if dest_field not in destinations and move_filter.is_legal(move):
+            destinations.append(dest_field)
+    return destinations
+
+
+class LegalPositionFigure(PositionFigure):
+    # PositionFigure answering only moves that keep the own king safe
+    __slots__ = ()
+
+    def generate_moves(self) -> list:
+        return legal_moves_from(self.board, self.field)
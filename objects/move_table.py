@@ -0,0 +1,56 @@
+from exceptions import FieldOutOfBoundsError
+from squares import SQUARES
+
+
+class MoveTable:
+    # destinations of every figure on every field of an empty board,
+    # built lazily per figure class on first lookup
+    def __init__(self):
+        self._moves = dict()
+        self._destinations = dict()
+
+    def moves(self, figure_class: type, field: str) -> tuple:
+        try:
+            return self._get_moves(figure_class)[field]
+        except KeyError:
+            raise FieldOutOfBoundsError("Field does not exist.")
+
+    def table(self, figure_class: type) -> dict:
+        return self._get_moves(figure_class)
+
+    def load(self, figure_class: type, moves: dict) -> None:
+        # installs precomputed moves instead of building them
+        self._destinations[figure_class] = {
+            field: frozenset(field_moves) for field, field_moves in moves.items()
+        }
+        self._moves[figure_class] = moves
+
+    def is_permitted(self, figure_class: type, field: str, dest_field: str) -> bool:
+        try:
+            destinations = self._get_destinations(figure_class)[field]
+        except KeyError:
+            raise FieldOutOfBoundsError("Field does not exist.")
+        return dest_field in destinations
+
+    def _get_moves(self, figure_class: type) -> dict:
+        moves = self._moves.get(figure_class)
+        if moves is None:
+            moves = self._build(figure_class)
+        return moves
+
+    def _get_destinations(self, figure_class: type) -> dict:
+        destinations = self._destinations.get(figure_class)
+        if destinations is None:
+            self._build(figure_class)
+            destinations = self._destinations[figure_class]
+        return destinations
+
+    def _build(self, figure_class: type) -> dict:
+        moves = dict()
+        for field in SQUARES:
+            moves[field] = tuple(figure_class(field).generate_moves())
+        self.load(figure_class, moves)
+        return moves
+
+
+MOVE_TABLE = MoveTable()
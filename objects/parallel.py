@@ -0,0 +1,138 @@
+import multiprocessing
+import os
+
+from objects.batch import stack_move_matrices, validate_moves_batch
+from objects.board import Board
+from objects.legality import legal_moves
+from objects.perft import perft
+from settings import PARALLEL_WORKERS
+
+# perft is split into at least this many tasks per worker so that uneven
+# subtrees still keep every core busy until the end
+TASKS_PER_WORKER = 4
+VALIDATE_CHUNK_SIZE = 65536
+
+
+def worker_count(workers: int = None) -> int:
+    workers = workers or PARALLEL_WORKERS or os.cpu_count() or 1
+    return max(workers, 1)
+
+
+def create_pool(workers: int = None, figure_classes: dict = None):
+    # workers are forked where possible, so the ray, move and Zobrist tables
+    # built by the parent are shared copy-on-write instead of rebuilt
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    return context.Pool(
+        worker_count(workers),
+        initializer=warm_tables,
+        initargs=(tuple((figure_classes or dict()).values()),),
+    )
+
+
+def warm_tables(figure_classes: tuple) -> None:
+    if figure_classes:
+        stack_move_matrices(figure_classes)
+
+
+def split_perft(board: Board, depth: int, tasks: int) -> list:
+    # move sequences from the root, expanded ply by ply until there are enough
+    # of them, every sequence starts with a root move
+    frontier = [()]
+    plies = 0
+    while plies == 0 or len(frontier) < tasks and plies < depth - 1:
+        expanded = list()
+        for sequence in frontier:
+            for move in sequence:
+                board.make_move(move)
+            expanded.extend(sequence + (move,) for move in legal_moves(board))
+            for _ in sequence:
+                board.unmake_move()
+        frontier = expanded
+        plies += 1
+    return frontier
+
+
+def _perft_task(task: tuple) -> int:
+    fen, moves, depth = task
+    board = Board.from_fen(fen)
+    for move in moves:
+        board.make_move(move)
+    return perft(board, depth)
+
+
+def parallel_divide(board: Board, depth: int, workers: int = None, pool=None) -> dict:
+    # divide with the subtrees of the root moves counted by a process pool
+    if depth < 1:
+        raise ValueError("Depth must be at least 1.")
+    workers = worker_count(workers)
+    sequences = split_perft(board, depth, workers * TASKS_PER_WORKER)
+    fen = board.to_fen()
+    tasks = [(fen, sequence, depth - len(sequence)) for sequence in sequences]
+    if pool is None and workers > 1:
+        with create_pool(workers) as own_pool:
+            counts = own_pool.map(_perft_task, tasks, chunksize=1)
+    elif pool is None:
+        counts = list(map(_perft_task, tasks))
+    else:
+        counts = pool.map(_perft_task, tasks, chunksize=1)
+    nodes = dict()
+    for (_, sequence, _), count in zip(tasks, counts):
+        nodes[sequence[0]] = nodes.get(sequence[0], 0) + count
+    return nodes
+
+
+def parallel_perft(board: Board, depth: int, workers: int = None, pool=None) -> int:
+    if depth == 0:
+        return 1
+    return sum(parallel_divide(board, depth, workers, pool).values())
+
+
+def _validate_task(task: tuple):
+    return validate_moves_batch(*task)
+
+
+def validate_moves_parallel(
+    figure_classes: dict,
+    figures,
+    current_fields,
+    dest_fields,
+    workers: int = None,
+    pool=None,
+    chunk_size: int = VALIDATE_CHUNK_SIZE,
+) -> tuple:
+    # validate_moves_batch over chunks of the triples spread across a pool
+    import numpy as np
+
+    figures, current_fields, dest_fields = (
+        list(figures),
+        list(current_fields),
+        list(dest_fields),
+    )
+    if not len(figures) == len(current_fields) == len(dest_fields):
+        raise ValueError("Figures and fields must have the same length.")
+    workers = worker_count(workers)
+    if pool is None and (workers == 1 or len(figures) <= chunk_size):
+        return validate_moves_batch(
+            figure_classes, figures, current_fields, dest_fields
+        )
+
+    tasks = [
+        (
+            figure_classes,
+            figures[start : start + chunk_size],
+            current_fields[start : start + chunk_size],
+            dest_fields[start : start + chunk_size],
+        )
+        for start in range(0, len(figures), chunk_size)
+    ]
+    if pool is None:
+        with create_pool(workers, figure_classes) as own_pool:
+            results = own_pool.map(_validate_task, tasks)
+    else:
+        results = pool.map(_validate_task, tasks)
+    if not results:
+        return validate_moves_batch(figure_classes, (), (), ())
+    valid = np.concatenate([chunk_valid for chunk_valid, _ in results])
+    errors = np.concatenate([chunk_errors for _, chunk_errors in results])
+    return valid, errors
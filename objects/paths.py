@@ -0,0 +1,72 @@
+from array import array
+from collections import deque
+
+from objects.move_table import MOVE_TABLE
+from squares import SQUARES, SQUARE_INDEX, field_to_index
+
+UNREACHABLE = 255
+
+
+class PathTable:
+    # all-pairs minimum move counts of every figure on an empty board, built
+    # lazily per figure class with one BFS per source field; distances and BFS
+    # parents are kept as 64x64 byte arrays indexed by source * 64 + target
+    def __init__(self):
+        self._tables = dict()
+
+    def distance(self, figure_class: type, field: str, dest_field: str) -> int:
+        source, target = field_to_index(field), field_to_index(dest_field)
+        distances, _ = self._get_tables(figure_class)
+        distance = distances[source * len(SQUARES) + target]
+        return None if distance == UNREACHABLE else distance
+
+    def path(self, figure_class: type, field: str, dest_field: str) -> list:
+        # fields visited after leaving field, one per move, or None
+        source, target = field_to_index(field), field_to_index(dest_field)
+        distances, parents = self._get_tables(figure_class)
+        if distances[source * len(SQUARES) + target] == UNREACHABLE:
+            return None
+        path = list()
+        while target != source:
+            path.append(SQUARES[target])
+            target = parents[source * len(SQUARES) + target]
+        path.reverse()
+        return path
+
+    def tables(self, figure_class: type) -> (array, array):
+        return self._get_tables(figure_class)
+
+    def load(self, figure_class: type, distances, parents) -> None:
+        # installs precomputed byte tables, e.g. views of a mapped table file
+        self._tables[figure_class] = distances, parents
+
+    def _get_tables(self, figure_class: type) -> (array, array):
+        tables = self._tables.get(figure_class)
+        if tables is None:
+            tables = self._tables[figure_class] = self._build(figure_class)
+        return tables
+
+    def _build(self, figure_class: type) -> (array, array):
+        size = len(SQUARES)
+        table = MOVE_TABLE.table(figure_class)
+        neighbours = [
+            [SQUARE_INDEX[move] for move in table[field]] for field in SQUARES
+        ]
+        distances = array("B", [UNREACHABLE]) * (size * size)
+        parents = array("B", [0]) * (size * size)
+        for source in range(size):
+            offset = source * size
+            distances[offset + source] = 0
+            parents[offset + source] = source
+            queue = deque([source])
+            while queue:
+                current = queue.popleft()
+                for neighbour in neighbours[current]:
+                    if distances[offset + neighbour] == UNREACHABLE:
+                        distances[offset + neighbour] = distances[offset + current] + 1
+                        parents[offset + neighbour] = current
+                        queue.append(neighbour)
+        return distances, parents
+
+
+PATH_TABLE = PathTable()
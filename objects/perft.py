@@ -0,0 +1,34 @@
+from objects.board import Board, Move
+from objects.legality import legal_moves
+from squares import SQUARES
+
+
+def perft(board: Board, depth: int) -> int:
+    # number of leaf positions reachable in depth legal moves
+    if depth == 0:
+        return 1
+    moves = legal_moves(board)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        board.make_move(move)
+        nodes += perft(board, depth - 1)
+        board.unmake_move()
+    return nodes
+
+
+def divide(board: Board, depth: int) -> dict:
+    # perft split by root move
+    nodes = dict()
+    for move in legal_moves(board):
+        board.make_move(move)
+        nodes[move] = perft(board, depth - 1)
+        board.unmake_move()
+    return nodes
+
+
+def move_name(move: Move) -> str:
+    return f"{SQUARES[move.from_index]}{SQUARES[move.to_index]}".lower() + (
+        move.promotion or ""
+    )
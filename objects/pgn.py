@@ -0,0 +1,164 @@
+import gzip
+import re
+from itertools import islice
+
+from exceptions import (
+    InvalidNotationError,
+    InvalidPositionError,
+    MoveNotPermittedError,
+)
+from objects.board import BLACK, START_FEN, Board
+from objects.legality import LegalMoveFilter
+from squares import BOARD_SIZE, SQUARE_COORDINATES, SQUARE_INDEX
+
+GZIP_MAGIC = b"\x1f\x8b"
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+
+HEADER_PATTERN = re.compile(r'^\[(\w+)\s+"(.*)"\]\s*$')
+# comments, variation brackets, numeric annotation glyphs and everything else
+TOKEN_PATTERN = re.compile(r"\{[^}]*\}?|;[^\n]*|[()]|\$\d+|[^\s{}();$]+")
+MOVE_NUMBER_PATTERN = re.compile(r"^\d+\.+")
+SAN_PATTERN = re.compile(r"^([NBRQK])?([a-h])?([1-8])?(x)?([a-h][1-8])(?:=?([NBRQ]))?$")
+# castling notation -> fields the king moves
+CASTLING_SAN = {"O-O": 2, "O-O-O": -2, "0-0": 2, "0-0-0": -2}
+
+
+def open_pgn(path: str):
+    # text lines of a plain or gzip compressed PGN file
+    with open(path, "rb") as file:
+        compressed = file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def read_games(lines):
+    # yields (headers, movetext) per game, only one game is held at a time
+    headers, movetext = dict(), list()
+    for line in lines:
+        header = HEADER_PATTERN.match(line)
+        if header is not None:
+            if movetext:
+                yield headers, " ".join(movetext)
+                headers, movetext = dict(), list()
+            headers[header.group(1)] = header.group(2)
+        elif line.strip() and not line.startswith("%"):
+            movetext.append(line.strip())
+    if headers or movetext:
+        yield headers, " ".join(movetext)
+
+
+def san_tokens(movetext: str):
+    # SAN moves of the main line, comments, variations and glyphs are skipped
+    depth = 0
+    for token in TOKEN_PATTERN.findall(movetext):
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth = max(depth - 1, 0)
+        elif depth == 0 and token[0] not in "{;$":
+            token = MOVE_NUMBER_PATTERN.sub("", token)
+            if token and token not in RESULTS:
+                yield token
+
+
+def parse_san(board: Board, san: str):
+    # the legal move of the side to move written as san
+    move_filter = LegalMoveFilter(board)
+    candidates = [
+        move for move in san_candidates(board, san) if move_filter.is_legal(move)
+    ]
+    if not candidates:
+        raise MoveNotPermittedError("Current move is not permitted.")
+    if len(candidates) > 1:
+        raise InvalidNotationError("Move notation is ambiguous.")
+    return candidates[0]
+
+
+def san_candidates(board: Board, san: str) -> list:
+    # pseudo-legal moves matching san
+    notation = san.rstrip("+#!?")
+    if notation in CASTLING_SAN:
+        king = board.king_index(board.side_to_move)
+        if king is None:
+            return []
+        shift = CASTLING_SAN[notation]
+        return [
+            move
+            for move in board.piece_moves(king)
+            if move.to_index - move.from_index == shift
+        ]
+
+    match = SAN_PATTERN.match(notation)
+    if match is None:
+        raise InvalidNotationError("Move notation is not valid.")
+    piece, file, rank, capture, target, promotion = match.groups()
+    target = SQUARE_INDEX[target.upper()]
+    if piece is None:
+        # a pawn push stays on its file, a capture names the file it leaves
+        if capture and file is None:
+            raise InvalidNotationError("Move notation is not valid.")
+        is_capture = board.squares[target] is not None or target == board.en_passant
+        if bool(capture) != is_capture:
+            return []
+        file = file or chr(ord("a") + SQUARE_COORDINATES[target][1])
+    piece = piece or "P"
+    if board.side_to_move == BLACK:
+        piece = piece.lower()
+    promotion = promotion.lower() if promotion else None
+    column = None if file is None else ord(file) - ord("a")
+    row = None if rank is None else BOARD_SIZE - int(rank)
+    return [
+        move
+        for index, square_piece in enumerate(board.squares)
+        if square_piece == piece
+        and (column is None or SQUARE_COORDINATES[index][1] == column)
+        and (row is None or SQUARE_COORDINATES[index][0] == row)
+        for move in board.piece_moves(index)
+        if move.to_index == target and move.promotion == promotion
+        # castling is only written as O-O or O-O-O
+        and not (piece in "Kk" and abs(move.to_index - move.from_index) == 2)
+    ]
+
+
+def validate_game(game: tuple) -> dict:
+    # plays the main line of a (headers, movetext) game, stopping at the first
+    # move that cannot be parsed or is not legal
+    headers, movetext = game
+    result = dict(
+        event=headers.get("Event"),
+        white=headers.get("White"),
+        black=headers.get("Black"),
+        result=headers.get("Result"),
+        plies=0,
+        valid=True,
+        error=None,
+        move=None,
+    )
+    try:
+        board = Board.from_fen(headers.get("FEN", START_FEN))
+    except InvalidPositionError as err:
+        result.update(valid=False, error=err.args[0])
+        return result
+    for san in san_tokens(movetext):
+        try:
+            board.make_move(parse_san(board, san))
+        except (InvalidNotationError, MoveNotPermittedError) as err:
+            result.update(valid=False, error=err.args[0], move=san)
+            return result
+        result["plies"] += 1
+    return result
+
+
+def validate_games(games, pool=None, window: int = 1024):
+    # validated results in input order, with a pool the games are sent in
+    # windows so memory stays bounded however long the archive is
+    if pool is None:
+        yield from map(validate_game, games)
+        return
+    games = iter(games)
+    while True:
+        chunk = list(islice(games, window))
+        if not chunk:
+            return
+        yield from pool.imap(validate_game, chunk, chunksize=max(len(chunk) // 64, 1))
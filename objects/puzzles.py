@@ -0,0 +1,154 @@
+from functools import lru_cache
+from time import perf_counter
+
+from objects.bitboard import ATTACK_MASKS
+from objects.Figure import Knight, Queen
+from squares import BOARD_SIZE, SQUARES, field_to_index
+
+FULL_BOARD = (1 << len(SQUARES)) - 1
+# rows of the board as masks, row 0 is rank 8
+ROW_MASKS = tuple(
+    ((1 << BOARD_SIZE) - 1) << row * BOARD_SIZE for row in range(BOARD_SIZE)
+)
+# deadline checks are done every this many search nodes
+CHECK_INTERVAL = 1024
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class Search:
+    # node counter with a time budget shared by one solver run
+    __slots__ = ("deadline", "nodes")
+
+    def __init__(self, budget: float):
+        self.deadline = perf_counter() + budget
+        self.nodes = 0
+
+    def visit(self) -> None:
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0 and perf_counter() > self.deadline:
+            raise BudgetExceeded()
+
+
+@lru_cache(maxsize=None)
+def square_masks(figure_class: type) -> tuple:
+    # destination mask of the figure on every square index
+    return tuple(ATTACK_MASKS.mask(figure_class, field) for field in SQUARES)
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def bit_indexes(mask: int) -> list:
+    indexes = list()
+    while mask:
+        lowest_bit = mask & -mask
+        indexes.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+    return indexes
+
+
+def knights_tour(field: str, budget: float) -> (list, int):
+    # open tour visiting every field once, Warnsdorff's rule orders the moves
+    # and backtracking recovers from its dead ends; returns the fields in
+    # visiting order, or None when the budget runs out, and the node count
+    start = field_to_index(field)
+    masks = square_masks(Knight)
+    search = Search(budget)
+    path = [start]
+
+    def extend(square: int, unvisited: int) -> bool:
+        search.visit()
+        if not unvisited:
+            return True
+        candidates = bit_indexes(masks[square] & unvisited)
+        # fewest onward moves first, ties go to the field nearer the edge
+        candidates.sort(
+            key=lambda target: (
+                popcount(masks[target] & unvisited),
+                -popcount(masks[target]),
+            )
+        )
+        for target in candidates:
+            path.append(target)
+            if extend(target, unvisited & ~(1 << target)):
+                return True
+            path.pop()
+        return False
+
+    try:
+        solved = extend(start, FULL_BOARD & ~(1 << start))
+    except BudgetExceeded:
+        return None, search.nodes
+    return [SQUARES[index] for index in path] if solved else None, search.nodes
+
+
+def eight_queens(budget: float) -> (list, int):
+    # every placement of one queen per row none of which attack each other,
+    # the squares left for the next rows are masked with the queen moves;
+    # returns the solutions as fields, or None when the budget runs out
+    masks = square_masks(Queen)
+    search = Search(budget)
+    solutions = list()
+    placed = list()
+
+    def place(row: int, free: int) -> None:
+        search.visit()
+        if row == BOARD_SIZE:
+            solutions.append([SQUARES[index] for index in placed])
+            return
+        for square in bit_indexes(free & ROW_MASKS[row]):
+            placed.append(square)
+            place(row + 1, free & ~masks[square] & ~(1 << square))
+            placed.pop()
+
+    try:
+        place(0, FULL_BOARD)
+    except BudgetExceeded:
+        return None, search.nodes
+    return solutions, search.nodes
+
+
+def queen_coverage(budget: float) -> (list, int):
+    # fewest queens attacking or occupying every field, searched with
+    # iterative deepening so the first cover found is minimal; the first
+    # uncovered field must be covered by a queen on it or on one of its queen
+    # moves, so only those are tried. Returns the queens' fields, or None when
+    # the budget runs out, and the node count
+    masks = square_masks(Queen)
+    coverage = tuple(mask | 1 << square for square, mask in enumerate(masks))
+    most_covered = max(popcount(mask) for mask in coverage)
+    search = Search(budget)
+    placed = list()
+    failed = set()
+
+    def cover(covered: int, queens: int) -> bool:
+        search.visit()
+        uncovered = FULL_BOARD & ~covered
+        if not uncovered:
+            return True
+        if queens == 0 or popcount(uncovered) > queens * most_covered:
+            return False
+        if (covered, queens) in failed:
+            return False
+        first = (uncovered & -uncovered).bit_length() - 1
+        candidates = bit_indexes(coverage[first])
+        candidates.sort(key=lambda square: -popcount(coverage[square] & uncovered))
+        for square in candidates:
+            placed.append(square)
+            if cover(covered | coverage[square], queens - 1):
+                return True
+            placed.pop()
+        failed.add((covered, queens))
+        return False
+
+    queens = 1
+    try:
+        while not cover(0, queens):
+            queens += 1
+    except BudgetExceeded:
+        return None, search.nodes
+    return [SQUARES[index] for index in placed], search.nodes
@@ -0,0 +1,42 @@
+from collections import namedtuple
+
+from exceptions import FieldOutOfBoundsError, MoveNotPermittedError
+
+# error codes of move queries
+VALID = 0
+UNKNOWN_FIGURE = 1
+FIELD_OUT_OF_BOUNDS = 2
+MOVE_NOT_PERMITTED = 3
+
+ERROR_MESSAGES = {
+    VALID: None,
+    UNKNOWN_FIGURE: None,
+    FIELD_OUT_OF_BOUNDS: "Field does not exist.",
+    MOVE_NOT_PERMITTED: "Current move is not permitted.",
+}
+ERROR_EXCEPTIONS = {
+    FIELD_OUT_OF_BOUNDS: FieldOutOfBoundsError,
+    MOVE_NOT_PERMITTED: MoveNotPermittedError,
+}
+
+
+class MoveResult(namedtuple("MoveResult", ["ok", "moves", "code"])):
+    # outcome of a move query, a rejected query is an error code instead of a
+    # raised exception so invalid input costs no more than valid input
+    __slots__ = ()
+
+    @property
+    def error(self) -> str:
+        return ERROR_MESSAGES[self.code]
+
+    def raise_for_error(self) -> None:
+        exception = ERROR_EXCEPTIONS.get(self.code)
+        if exception is not None:
+            raise exception(ERROR_MESSAGES[self.code])
+
+
+# shared by every query, the results are immutable
+VALID_MOVE_RESULT = MoveResult(True, (), VALID)
+UNKNOWN_FIGURE_RESULT = MoveResult(False, (), UNKNOWN_FIGURE)
+FIELD_OUT_OF_BOUNDS_RESULT = MoveResult(False, (), FIELD_OUT_OF_BOUNDS)
+MOVE_NOT_PERMITTED_RESULT = MoveResult(False, (), MOVE_NOT_PERMITTED)
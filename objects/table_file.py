@@ -0,0 +1,115 @@
+import hashlib
+import mmap
+import struct
+import sys
+
+from objects.backends import FIGURE_BACKENDS
+from objects.move_table import MOVE_TABLE
+from objects.paths import PATH_TABLE
+from squares import SQUARES, SQUARE_INDEX
+
+TABLE_MAGIC = b"CHESSTBL"
+# bump whenever the layout or the move generation changes
+TABLE_VERSION = 1
+# magic, version, squares, figure count, payload size, blake2b of the payload
+HEADER = struct.Struct("<8sHHHI16s")
+NAME_SIZE = 16
+# move count followed by the destination indexes of one field
+MOVE_STRIDE = 32
+MOVES_SIZE = len(SQUARES) * MOVE_STRIDE
+PATHS_SIZE = len(SQUARES) * len(SQUARES)
+FIGURE_SIZE = NAME_SIZE + MOVES_SIZE + 2 * PATHS_SIZE
+
+
+def checksum(payload) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def build_table_file(path: str, figure_classes: dict = None) -> int:
+    # serializes move lists and shortest path tables of every figure class,
+    # returns the file size
+    figure_classes = figure_classes or FIGURE_BACKENDS["table"]
+    payload = bytearray()
+    for figure_class in figure_classes.values():
+        payload += figure_class.__name__.encode().ljust(NAME_SIZE, b"\0")
+        table = MOVE_TABLE.table(figure_class)
+        for field in SQUARES:
+            moves = [SQUARE_INDEX[move] for move in table[field]]
+            payload += bytes([len(moves)] + moves).ljust(MOVE_STRIDE, b"\0")
+        distances, parents = PATH_TABLE.tables(figure_class)
+        payload += distances.tobytes() + parents.tobytes()
+    header = HEADER.pack(
+        TABLE_MAGIC,
+        TABLE_VERSION,
+        len(SQUARES),
+        len(figure_classes),
+        len(payload),
+        checksum(payload),
+    )
+    with open(path, "wb") as file:
+        file.write(header + payload)
+    return HEADER.size + len(payload)
+
+
+class TableFile:
+    # read-only mapping of a table file, every process mapping the same file
+    # shares its pages through the page cache
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if len(view) < HEADER.size:
+            raise ValueError("Table file is truncated.")
+        magic, version, squares, count, size, digest = HEADER.unpack_from(view)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION:
+            raise ValueError("Table file version is not supported.")
+        if squares != len(SQUARES) or size != count * FIGURE_SIZE:
+            raise ValueError("Table file does not match the board.")
+        payload = view[HEADER.size : HEADER.size + size]
+        if len(payload) != size or checksum(payload) != digest:
+            raise ValueError("Table file checksum does not match.")
+        self._figures = dict()
+        for offset in range(0, size, FIGURE_SIZE):
+            name = bytes(payload[offset : offset + NAME_SIZE]).rstrip(b"\0").decode()
+            self._figures[name] = payload[offset + NAME_SIZE : offset + FIGURE_SIZE]
+
+    def __contains__(self, figure_class: type) -> bool:
+        return figure_class.__name__ in self._figures
+
+    def moves(self, figure_class: type) -> dict:
+        block = self._figures[figure_class.__name__]
+        moves = dict()
+        for index, field in enumerate(SQUARES):
+            offset = index * MOVE_STRIDE
+            count = block[offset]
+            moves[field] = tuple(
+                SQUARES[move] for move in block[offset + 1 : offset + 1 + count]
+            )
+        return moves
+
+    def paths(self, figure_class: type) -> (memoryview, memoryview):
+        block = self._figures[figure_class.__name__]
+        distances = block[MOVES_SIZE : MOVES_SIZE + PATHS_SIZE]
+        return distances, block[MOVES_SIZE + PATHS_SIZE :]
+
+
+def load_table_file(path: str, figure_classes: dict = None) -> bool:
+    # installs the tables of the file, False when it is missing or invalid so
+    # the tables are computed on the fly as before
+    figure_classes = figure_classes or FIGURE_BACKENDS["table"]
+    try:
+        table_file = TableFile(path)
+    except (OSError, ValueError):
+        return False
+    for figure_class in figure_classes.values():
+        # bitboard figures share the tables of the figure they stand for
+        source_class = getattr(figure_class, "move_class", figure_class)
+        if source_class in table_file:
+            MOVE_TABLE.load(figure_class, table_file.moves(source_class))
+            PATH_TABLE.load(figure_class, *table_file.paths(source_class))
+    return True
+
+
+if __name__ == "__main__":
+    # python -m objects.table_file tables.bin
+    print(build_table_file(sys.argv[1]), "bytes written")
@@ -0,0 +1,143 @@
+import random
+from array import array
+from threading import Lock
+
+from exceptions import MoveNotPermittedError
+from objects.board import Board
+from objects.legality import LegalPositionFigure, legal_moves_from
+from squares import SQUARES, SQUARE_INDEX, field_to_index
+
+ALWAYS_REPLACE = "always"
+DEPTH_PREFERRED = "depth"
+REPLACEMENT_POLICIES = (ALWAYS_REPLACE, DEPTH_PREFERRED)
+
+# most destinations one figure can have, a queen in the middle of the board
+MAX_MOVES = 27
+EMPTY = 255
+# key, destination mask, depth, move count and the move list
+ENTRY_BYTES = 8 + 8 + 1 + 1 + MAX_MOVES
+
+_query_random = random.Random(0x7AB1E)
+# mixed into the position hash so every queried field gets its own key
+QUERY_KEYS = tuple(_query_random.getrandbits(64) for _ in SQUARES)
+
+
+class TranspositionTable:
+    # fixed size hash table over preallocated arrays, the slot of a key is its
+    # low bits and the full 64-bit key is kept to detect collisions
+    def __init__(self, max_bytes: int, policy: str = ALWAYS_REPLACE):
+        if policy not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Unknown replacement policy: {policy}")
+        entries = 1
+        while entries * 2 * ENTRY_BYTES <= max_bytes:
+            entries *= 2
+        self.policy = policy
+        self.entries = entries
+        self._mask = entries - 1
+        self._keys = array("Q", [0]) * entries
+        self._destinations = array("Q", [0]) * entries
+        self._depths = array("B", [0]) * entries
+        self._counts = array("B", [EMPTY]) * entries
+        self._moves = array("B", [0]) * (entries * MAX_MOVES)
+        self._lock = Lock()
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+        self.rejections = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self.entries * ENTRY_BYTES
+
+    def probe(self, key: int) -> (tuple, int):
+        # returns the stored square indexes and destination mask, or None
+        slot = key & self._mask
+        with self._lock:
+            self.probes += 1
+            count = self._counts[slot]
+            if count == EMPTY or self._keys[slot] != key:
+                return None
+            self.hits += 1
+            offset = slot * MAX_MOVES
+            return tuple(self._moves[offset : offset + count]), self._destinations[slot]
+
+    def store(self, key: int, moves: list, destinations: int, depth: int = 0) -> bool:
+        if len(moves) > MAX_MOVES:
+            return False
+        slot = key & self._mask
+        with self._lock:
+            count = self._counts[slot]
+            if count != EMPTY and self._keys[slot] != key:
+                if self.policy == DEPTH_PREFERRED and depth < self._depths[slot]:
+                    self.rejections += 1
+                    return False
+                self.replacements += 1
+            offset = slot * MAX_MOVES
+            self._moves[offset : offset + len(moves)] = array("B", moves)
+            self._keys[slot] = key
+            self._destinations[slot] = destinations
+            self._depths[slot] = depth
+            self._counts[slot] = len(moves)
+            self.stores += 1
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts = array("B", [EMPTY]) * self.entries
+            self.probes = self.hits = self.stores = 0
+            self.replacements = self.rejections = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(
+                entries=self.entries,
+                sizeBytes=self.size_bytes,
+                policy=self.policy,
+                probes=self.probes,
+                hits=self.hits,
+                hitRate=self.hits / self.probes if self.probes else 0.0,
+                stores=self.stores,
+                replacements=self.replacements,
+                rejections=self.rejections,
+            )
+
+
+def position_key(board: Board, field: str) -> int:
+    return board.hash ^ QUERY_KEYS[field_to_index(field)]
+
+
+def cached_legal_moves_from(table: TranspositionTable, board: Board, field: str):
+    # legal destinations of the figure on field and their 64-bit mask
+    key = position_key(board, field)
+    entry = table.probe(key)
+    if entry is not None:
+        indexes, destinations = entry
+        return [SQUARES[index] for index in indexes], destinations
+    moves = legal_moves_from(board, field)
+    indexes = [SQUARE_INDEX[move] for move in moves]
+    destinations = 0
+    for index in indexes:
+        destinations |= 1 << index
+    # position queries have no search depth, the destination count stands in
+    # for it since longer move lists cost more to generate again
+    table.store(key, indexes, destinations, depth=len(indexes))
+    return moves, destinations
+
+
+class CachedPositionFigure(LegalPositionFigure):
+    # LegalPositionFigure answering from a TranspositionTable
+    __slots__ = ("table",)
+
+    def __init__(self, field: str, board: Board, table: TranspositionTable):
+        super().__init__(field, board)
+        self.table = table
+
+    def generate_moves(self) -> list:
+        return cached_legal_moves_from(self.table, self.board, self.field)[0]
+
+    def validate_move(self, dest_field: str) -> None:
+        _, destinations = cached_legal_moves_from(self.table, self.board, self.field)
+        dest_index = SQUARE_INDEX.get(dest_field)
+        if dest_index is None or not destinations >> dest_index & 1:
+            raise MoveNotPermittedError("Current move is not permitted.")
@@ -1,19 +1,50 @@
-import numpy as np
-
-CHESS_BOARD = np.array(
-    [
-        ["A8", "B8", "C8", "D8", "E8", "F8", "G8", "H8"],
-        ["A7", "B7", "C7", "D7", "E7", "F7", "G7", "H7"],
-        ["A6", "B6", "C6", "D6", "E6", "F6", "G6", "H6"],
-        ["A5", "B5", "C5", "D5", "E5", "F5", "G5", "H5"],
-        ["A4", "B4", "C4", "D4", "E4", "F4", "G4", "H4"],
-        ["A3", "B3", "C3", "D3", "E3", "F3", "G3", "H3"],
-        ["A2", "B2", "C2", "D2", "E2", "F2", "G2", "H2"],
-        ["A1", "B1", "C1", "D1", "E1", "F1", "G1", "H1"],
-    ],
-    dtype=str,
+import os
+
+CHESS_FIELDS = (
+    ("A8", "B8", "C8", "D8", "E8", "F8", "G8", "H8"),
+    ("A7", "B7", "C7", "D7", "E7", "F7", "G7", "H7"),
+    ("A6", "B6", "C6", "D6", "E6", "F6", "G6", "H6"),
+    ("A5", "B5", "C5", "D5", "E5", "F5", "G5", "H5"),
+    ("A4", "B4", "C4", "D4", "E4", "F4", "G4", "H4"),
+    ("A3", "B3", "C3", "D3", "E3", "F3", "G3", "H3"),
+    ("A2", "B2", "C2", "D2", "E2", "F2", "G2", "H2"),
+    ("A1", "B1", "C1", "D1", "E1", "F1", "G1", "H1"),
 )
 CHESS_DIAGONALS = [(1, 1), (-1, 1), (1, -1), (-1, -1)]
 CHESS_CARDINALS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
 
 CHESS_DIMENSION = [0, 8]
+
+FIGURE_BACKEND = os.environ.get("FIGURE_BACKEND", "table")
+
+BATCH_MAX_SIZE = int(os.environ.get("BATCH_MAX_SIZE", 4096))
+
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", 32768))
+RESPONSE_CACHE_MAX_AGE = int(os.environ.get("RESPONSE_CACHE_MAX_AGE", 86400))
+
+# precomputed tables built by python -m objects.table_file, unset to compute
+TABLE_FILE = os.environ.get("TABLE_FILE", "")
+
+TRANSPOSITION_TABLE_BYTES = int(os.environ.get("TRANSPOSITION_TABLE_BYTES", 16 << 20))
+TRANSPOSITION_TABLE_POLICY = os.environ.get("TRANSPOSITION_TABLE_POLICY", "always")
+
+# 0 uses every CPU core
+PARALLEL_WORKERS = int(os.environ.get("PARALLEL_WORKERS", 0))
+
+# seconds a puzzle solver may search, requests may ask for up to the maximum
+PUZZLE_TIME_BUDGET = float(os.environ.get("PUZZLE_TIME_BUDGET", 1.0))
+PUZZLE_MAX_TIME_BUDGET = float(os.environ.get("PUZZLE_MAX_TIME_BUDGET", 5.0))
+
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "0") == "1"
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+
+
+def __getattr__(name: str):
+    # CHESS_BOARD is a NumPy array, built on first access so that importing
+    # settings does not import NumPy
+    if name == "CHESS_BOARD":
+        import numpy as np
+
+        globals()[name] = np.array(CHESS_FIELDS, dtype=str)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,77 @@
+from exceptions import FieldOutOfBoundsError
+from settings import CHESS_FIELDS, CHESS_DIMENSION
+
+BOARD_SIZE = CHESS_DIMENSION[1] - CHESS_DIMENSION[0]
+
+# squares are indexed in CHESS_BOARD order: A8 is 0, H1 is 63
+SQUARES = tuple(field for row in CHESS_FIELDS for field in row)
+SQUARE_INDEX = {field: index for index, field in enumerate(SQUARES)}
+SQUARE_COORDINATES = tuple(divmod(index, BOARD_SIZE) for index in range(len(SQUARES)))
+FIELD_COORDINATES = dict(zip(SQUARES, SQUARE_COORDINATES))
+
+
+def field_to_index(field: str) -> int:
+    try:
+        return SQUARE_INDEX[field]
+    except (KeyError, TypeError):
+        raise FieldOutOfBoundsError("Field does not exist.")
+
+
+def field_to_coordinates(field: str) -> (int, int):
+    try:
+        return FIELD_COORDINATES[field]
+    except (KeyError, TypeError):
+        raise FieldOutOfBoundsError("Field does not exist.")
+
+
+def index_to_field(index: int) -> str:
+    if not 0 <= index < len(SQUARES):
+        raise FieldOutOfBoundsError("Field does not exist.")
+    return SQUARES[index]
+
+
+def index_to_coordinates(index: int) -> (int, int):
+    if not 0 <= index < len(SQUARES):
+        raise FieldOutOfBoundsError("Field does not exist.")
+    return SQUARE_COORDINATES[index]
+
+
+def coordinates_to_index(x: int, y: int) -> int:
+    if not (0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE):
+        raise FieldOutOfBoundsError("Field does not exist.")
+    return x * BOARD_SIZE + y
+
+
+def coordinates_to_field(x: int, y: int) -> str:
+    return SQUARES[coordinates_to_index(x, y)]
+
+
+class Square(int):
+    # integer coded square, instances are interned so parsing allocates nothing
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, field: str) -> "Square":
+        try:
+            return FIELD_SQUARES[field]
+        except (KeyError, TypeError):
+            raise FieldOutOfBoundsError("Field does not exist.")
+
+    @classmethod
+    def from_coordinates(cls, x: int, y: int) -> "Square":
+        return SQUARE_OBJECTS[coordinates_to_index(x, y)]
+
+    @property
+    def field(self) -> str:
+        return SQUARES[self]
+
+    @property
+    def coordinates(self) -> (int, int):
+        return SQUARE_COORDINATES[self]
+
+    def __repr__(self) -> str:
+        return f"Square({SQUARES[self]})"
+
+
+SQUARE_OBJECTS = tuple(Square(index) for index in range(len(SQUARES)))
+FIELD_SQUARES = dict(zip(SQUARES, SQUARE_OBJECTS))
@@ -1,4 +1,6 @@
 from app import app
+from objects.board import START_FEN
+from settings import BATCH_MAX_SIZE
 
 
 def test_get_list_available_moves_response_200():
@@ -91,3 +93,217 @@ def test_get_validate_invalid_move_pawn_response_409():
 def get_error(response: app.response_class) -> str:
     body = response.json
     return body["error"]
+
+
+def test_post_batch_moves_response_200():
+    queries = [
+        dict(figure="rook", currentField="H4"),
+        dict(figure="knight", currentField="H4"),
+    ]
+    response = app.test_client().post("/api/v1/batch/moves", json=dict(queries=queries))
+    results = response.json["results"]
+    assert response.status_code == 200
+    assert [result["status"] for result in results] == [200, 200]
+    assert (
+        results[1]["availableMoves"]
+        == app.test_client().get("/api/v1/knight/H4").json["availableMoves"]
+    )
+
+
+def test_post_batch_moves_reports_invalid_entries():
+    queries = [
+        dict(figure="paulatubyla", currentField="H4"),
+        dict(figure="rook", currentField="H9"),
+        dict(figure="pawn", currentField="H4"),
+    ]
+    response = app.test_client().post("/api/v1/batch/moves", json=dict(queries=queries))
+    results = response.json["results"]
+    assert [result["status"] for result in results] == [404, 409, 200]
+    assert results[1]["error"] == "Field does not exist."
+    assert results[2]["availableMoves"] == ["H5"]
+
+
+def test_post_batch_moves_malformed_body_response_400():
+    response = app.test_client().post("/api/v1/batch/moves", json=dict(queries="H4"))
+    assert response.status_code == 400
+
+
+def test_post_batch_moves_too_many_queries_response_413():
+    queries = [dict(figure="rook", currentField="H4")] * (BATCH_MAX_SIZE + 1)
+    response = app.test_client().post("/api/v1/batch/moves", json=dict(queries=queries))
+    assert response.status_code == 413
+
+
+def test_post_batch_validate_matches_single_route():
+    queries = [
+        dict(figure="rook", currentField="H4", destField="H3"),
+        dict(figure="rook", currentField="H4", destField="G3"),
+        dict(figure="rook", currentField="H10", destField="H9"),
+        dict(figure="rook", currentField="H7", destField="S4"),
+        dict(figure="paulatubyla", currentField="H2", destField="G1"),
+    ]
+    response = app.test_client().post(
+        "/api/v1/batch/validate", json=dict(queries=queries)
+    )
+    assert response.status_code == 200
+    for query, result in zip(queries, response.json["results"]):
+        single = app.test_client().get(
+            f"/api/v1/{query['figure']}/{query['currentField']}/{query['destField']}"
+        )
+        assert result["status"] == single.status_code
+        if single.status_code != 404:
+            assert result["move"] == single.json["move"]
+            assert result["error"] == single.json["error"]
+
+
+def test_post_batch_validate_empty_queries_response_200():
+    response = app.test_client().post("/api/v1/batch/validate", json=dict(queries=[]))
+    assert response.status_code == 200 and response.json["results"] == []
+
+
+def test_get_position_available_moves_response_200():
+    response = app.test_client().get(
+        "/api/v1/position/G1", query_string=dict(fen=START_FEN)
+    )
+    assert response.status_code == 200
+    assert response.json["figure"] == "knight"
+    assert response.json["availableMoves"] == ["H3", "F3"]
+
+
+def test_get_position_unicode_digit_fen_response_400():
+    fen = "rnbqkbnr/pppppppp/²²²²/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    response = app.test_client().get("/api/v1/position/G1", query_string=dict(fen=fen))
+    assert response.status_code == 400
+
+
+def test_get_position_available_moves_invalid_fen_response_400():
+    response = app.test_client().get(
+        "/api/v1/position/G1", query_string=dict(fen="8/8 w")
+    )
+    assert response.status_code == 400
+
+
+def test_get_position_available_moves_empty_field_response_409():
+    response = app.test_client().get(
+        "/api/v1/position/E4", query_string=dict(fen=START_FEN)
+    )
+    assert response.status_code == 409 and get_error(response) == "Field is empty."
+
+
+def test_get_position_validate_move_response_200():
+    response = app.test_client().get(
+        "/api/v1/position/E2/E4", query_string=dict(fen=START_FEN)
+    )
+    assert response.status_code == 200 and response.json["move"] == "valid"
+
+
+def test_get_position_validate_blocked_move_response_409():
+    response = app.test_client().get(
+        "/api/v1/position/A1/A3", query_string=dict(fen=START_FEN)
+    )
+    assert response.status_code == 409
+    assert get_error(response) == "Current move is not permitted."
+
+
+def test_post_attack_map_response_200():
+    pieces = [
+        dict(figure="rook", currentField="H4"),
+        dict(figure="knight", currentField="H4"),
+        dict(figure="queen", currentField="A1"),
+    ]
+    response = app.test_client().post("/api/v1/attacks", json=dict(pieces=pieces))
+    attacks = response.json["attacks"]
+    assert response.status_code == 200
+    assert len(attacks) == 8 and all(len(row) == 8 for row in attacks)
+    assert attacks[4][0] == 2 and attacks[7][7] == 2 and attacks[4][7] == 0
+
+
+def test_post_attack_map_invalid_field_response_409():
+    pieces = [dict(figure="rook", currentField="H9")]
+    response = app.test_client().post("/api/v1/attacks", json=dict(pieces=pieces))
+    assert (
+        response.status_code == 409 and get_error(response) == "Field does not exist."
+    )
+
+
+def test_post_attack_map_invalid_figure_response_404():
+    pieces = [dict(figure="paulatubyla", currentField="H4")]
+    response = app.test_client().post("/api/v1/attacks", json=dict(pieces=pieces))
+    assert response.status_code == 404
+
+
+def test_get_shortest_path_knight_response_200():
+    response = app.test_client().get("/api/v1/path/knight/A1/H8")
+    assert response.status_code == 200
+    assert response.json["distance"] == 6 and len(response.json["path"]) == 6
+    assert response.json["path"][-1] == "H8"
+
+
+def test_get_shortest_path_unreachable_response_409():
+    response = app.test_client().get("/api/v1/path/bishop/A1/A2")
+    assert (
+        response.status_code == 409 and get_error(response) == "Field is not reachable."
+    )
+
+
+def test_get_shortest_path_wrong_position_response_409():
+    response = app.test_client().get("/api/v1/path/king/A1/A9")
+    assert (
+        response.status_code == 409 and get_error(response) == "Field does not exist."
+    )
+
+
+def test_get_shortest_path_invalid_figure_response_404():
+    response = app.test_client().get("/api/v1/path/paulatubyla/A1/A2")
+    assert response.status_code == 404
+
+
+def test_get_position_validate_pinned_move_response_409():
+    fen = "4r3/8/8/8/8/8/4R3/4K3 w - - 0 1"
+    response = app.test_client().get(
+        "/api/v1/position/E2/D2", query_string=dict(fen=fen)
+    )
+    assert response.status_code == 409
+
+
+def test_get_cache_stats_response_200():
+    app.test_client().get("/api/v1/position/E2", query_string=dict(fen=START_FEN))
+    app.test_client().get("/api/v1/position/E2", query_string=dict(fen=START_FEN))
+    response = app.test_client().get("/api/v1/cache/stats")
+    stats = response.json["positionTable"]
+    assert response.status_code == 200
+    assert stats["hits"] >= 1 and 0 < stats["hitRate"] <= 1
+    assert "hits" in response.json["responseCache"]
+    assert response.json["tableFile"]["loaded"] is False
+
+
+def test_get_board_available_moves_response_200():
+    response = app.test_client().get("/api/v1/board/16x16/knight/P16")
+    assert response.status_code == 200
+    assert response.json["availableMoves"] == ["O14", "N15"]
+
+
+def test_get_board_validate_move_response_409():
+    response = app.test_client().get("/api/v1/board/16x16/rook/A1/B2")
+    assert response.status_code == 409
+    assert response.json["move"] == "invalid"
+
+
+def test_get_board_unsupported_dimensions_response_400():
+    response = app.test_client().get("/api/v1/board/30x30/rook/A1")
+    assert response.status_code == 400
+    assert response.json["error"] == "Board dimensions are not supported."
+
+
+def test_get_board_unicode_digit_dimensions_response_400():
+    response = app.test_client().get("/api/v1/board/²x²/rook/A1")
+    assert response.status_code == 400
+    assert response.json["error"] == "Board dimensions are not supported."
+
+
+def test_get_position_validate_en_passant_without_king_response_200():
+    fen = "4k3/8/8/3pP3/8/8/8/8 w - d6 0 1"
+    response = app.test_client().get(
+        "/api/v1/position/E5/D6", query_string=dict(fen=fen)
+    )
+    assert response.status_code == 200 and response.json["move"] == "valid"
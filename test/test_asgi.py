@@ -0,0 +1,139 @@
+import asyncio
+import json
+
+from asgi import application
+
+
+def call(path: str, method: str = "GET") -> (int, dict):
+    messages = list()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": path}
+    asyncio.run(application(scope, receive, send))
+    return messages[0]["status"], json.loads(messages[1]["body"])
+
+
+def test_asgi_available_moves_response_200():
+    status, body = call("/api/v1/pawn/H4")
+    assert status == 200 and body["availableMoves"] == ["H5"]
+
+
+def test_asgi_validate_move_matches_wsgi_statuses():
+    assert call("/api/v1/rook/H4/H3")[0] == 200
+    assert call("/api/v1/rook/H4/G3")[0] == 409
+    assert call("/api/v1/rook/H10/H9")[1]["error"] == "Field does not exist."
+    assert call("/api/v1/paulatubyla/H2/G1")[0] == 404
+
+
+def test_asgi_unknown_path_and_method():
+    assert call("/api/v2/rook/H4")[0] == 404
+    assert call("/api/v1/rook/H4", method="POST")[0] == 405
+
+
+def test_asgi_lifespan():
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent = list()
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(application({"type": "lifespan"}, receive, send))
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+def test_asgi_negotiates_format():
+    messages = list()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/pawn/H4",
+        "headers": [(b"accept", b"application/vnd.chess.squares")],
+    }
+    asyncio.run(application(scope, receive, send))
+    assert (b"content-type", b"application/vnd.chess.squares") in messages[0]["headers"]
+    assert messages[1]["body"] == bytes([1, 31])
+
+
+def test_asgi_not_modified_response_304():
+    def request(path: str, etag: bytes = None) -> list:
+        messages = list()
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        headers = [] if etag is None else [(b"if-none-match", etag)]
+        scope = {"type": "http", "method": "GET", "path": path, "headers": headers}
+        asyncio.run(application(scope, receive, send))
+        return messages
+
+    etag = dict(request("/api/v1/rook/H4/H3")[0]["headers"])[b"etag"]
+    start, body = request("/api/v1/rook/H4/H3", etag)
+    assert start["status"] == 304 and body["body"] == b""
+    assert dict(start["headers"])[b"etag"] == etag
+    # error responses carry no ETag and are never revalidated
+    start, _ = request("/api/v1/rook/H4/G3", b"*")
+    assert start["status"] == 409 and b"etag" not in dict(start["headers"])
+
+
+def websocket(path: str, texts: list) -> list:
+    incoming = iter(
+        [{"type": "websocket.connect"}]
+        + [{"type": "websocket.receive", "text": text} for text in texts]
+        + [{"type": "websocket.disconnect", "code": 1000}]
+    )
+    messages = list()
+
+    async def receive():
+        return next(incoming)
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "websocket", "path": path, "headers": []}
+    asyncio.run(application(scope, receive, send))
+    return messages
+
+
+def test_asgi_websocket_streams_answers():
+    messages = websocket(
+        "/api/v1/ws",
+        [
+            json.dumps(dict(figure="pawn", currentField="H4", id=1)),
+            json.dumps(
+                [
+                    dict(figure="rook", currentField="H4", destField="H3"),
+                    dict(figure="rook", currentField="H9", destField="H3"),
+                    dict(figure=["rook"], currentField="H4"),
+                ]
+            ),
+            "not json",
+        ],
+    )
+    assert messages[0] == {"type": "websocket.accept"}
+    single, batch, error = [json.loads(message["text"]) for message in messages[1:]]
+    assert single["availableMoves"] == ["H5"] and single["id"] == 1
+    assert [result["status"] for result in batch["results"]] == [200, 409, 404]
+    assert error["status"] == 400
+
+
+def test_asgi_websocket_unknown_path_is_closed():
+    messages = websocket("/api/v1/rook/H4", [])
+    assert messages == [{"type": "websocket.close", "code": 4404}]
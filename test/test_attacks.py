@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from exceptions import FieldOutOfBoundsError
+from objects.attacks import attack_map
+from objects.backends import FIGURE_BACKENDS
+from squares import FIELD_COORDINATES, SQUARES
+
+CLASS_NAMES = FIGURE_BACKENDS["table"]
+
+
+def test_attack_map_counts_moves_of_every_piece():
+    random.seed(7)
+    figures = [random.choice(list(CLASS_NAMES)) for _ in range(300)]
+    fields = [random.choice(SQUARES) for _ in range(300)]
+    expected = [[0] * 8 for _ in range(8)]
+    for figure, field in zip(figures, fields):
+        for move in CLASS_NAMES[figure](field).list_available_moves():
+            x, y = FIELD_COORDINATES[move]
+            expected[x][y] += 1
+    assert attack_map(CLASS_NAMES, figures, fields).tolist() == expected
+
+
+def test_attack_map_without_pieces():
+    assert attack_map(CLASS_NAMES, [], []).sum() == 0
+
+
+def test_attack_map_invalid_input():
+    with pytest.raises(FieldOutOfBoundsError):
+        attack_map(CLASS_NAMES, ["rook"], ["H9"])
+    with pytest.raises(ValueError):
+        attack_map(CLASS_NAMES, ["paulatubyla"], ["H4"])
@@ -0,0 +1,51 @@
+import numpy as np
+
+from objects.backends import FIGURE_BACKENDS
+from objects.batch import (
+    list_moves_batch,
+    validate_moves_batch,
+    VALID,
+    UNKNOWN_FIGURE,
+    FIELD_OUT_OF_BOUNDS,
+    MOVE_NOT_PERMITTED,
+)
+from objects.Figure import Knight, Pawn
+from squares import SQUARES
+
+CLASS_NAMES = FIGURE_BACKENDS["table"]
+
+
+def test_list_moves_batch():
+    results = list_moves_batch([(Knight, "H4"), (Pawn, "H9"), (Pawn, "H4")])
+    assert results == [Knight("H4").list_available_moves(), None, ["H5"]]
+
+
+def test_validate_moves_batch_error_codes():
+    valid, errors = validate_moves_batch(
+        CLASS_NAMES,
+        ["rook", "rook", "rook", "rook", "paulatubyla"],
+        ["H4", "H4", "H10", "H7", "H2"],
+        ["H3", "G3", "H9", "S4", "G1"],
+    )
+    assert valid.tolist() == [True, False, False, False, False]
+    assert errors.tolist() == [
+        VALID,
+        MOVE_NOT_PERMITTED,
+        FIELD_OUT_OF_BOUNDS,
+        MOVE_NOT_PERMITTED,
+        UNKNOWN_FIGURE,
+    ]
+
+
+def test_validate_moves_batch_matches_figures_on_every_pair():
+    for name, figure_class in CLASS_NAMES.items():
+        currents = np.repeat(SQUARES, len(SQUARES))
+        dests = np.tile(SQUARES, len(SQUARES))
+        valid, _ = validate_moves_batch(
+            CLASS_NAMES, [name] * len(currents), currents, dests
+        )
+        expected = [
+            dest in figure_class(current).list_available_moves()
+            for current, dest in zip(currents.tolist(), dests.tolist())
+        ]
+        assert valid.tolist() == expected
@@ -0,0 +1,48 @@
+import pytest
+
+from exceptions import FieldOutOfBoundsError, MoveNotPermittedError
+from objects.backends import FIGURE_BACKENDS, get_figure_classes
+from objects.bitboard import ATTACK_MASKS, SQUARES, mask_to_fields, BitboardKnight
+from objects.Figure import Knight
+
+
+def test_square_indexes_follow_chess_board_order():
+    assert SQUARES[0] == "A8" and SQUARES[63] == "H1"
+
+
+def test_masks_match_table_backend_on_every_field():
+    for name, figure_class in FIGURE_BACKENDS["table"].items():
+        for field in SQUARES:
+            mask = ATTACK_MASKS.mask(figure_class, field)
+            expected = figure_class(field).list_available_moves()
+            assert sorted(mask_to_fields(mask)) == sorted(expected)
+
+
+def test_bitboard_backend_validates_like_table_backend():
+    for name, figure_class in FIGURE_BACKENDS["bitboard"].items():
+        table_class = FIGURE_BACKENDS["table"][name]
+        for dest_field in SQUARES + ("S4",):
+            expected = dest_field in table_class("D4").list_available_moves()
+            try:
+                figure_class("D4").validate_move(dest_field)
+                valid = True
+            except MoveNotPermittedError:
+                valid = False
+            assert valid == expected
+
+
+def test_bitboard_list_available_moves_keeps_order():
+    assert (
+        BitboardKnight("H4").list_available_moves()
+        == Knight("H4").list_available_moves()
+    )
+
+
+def test_bitboard_validate_move_field_out_of_board():
+    with pytest.raises(FieldOutOfBoundsError):
+        BitboardKnight("H9").validate_move("G7")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_figure_classes("abacus")
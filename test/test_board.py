@@ -0,0 +1,104 @@
+import pytest
+
+from exceptions import EmptyFieldError, InvalidPositionError, MoveNotPermittedError
+from objects.Figure import Context, Queen
+from objects.board import Board, PositionFigure, START_FEN
+
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+EMPTY_FEN = "8/8/8/8/8/8/8/8 w - - 0 1"
+
+
+def test_fen_round_trip():
+    for fen in (START_FEN, KIWIPETE_FEN):
+        assert Board.from_fen(fen).to_fen() == fen
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        None,
+        "",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNX w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkx - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq z9 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq g8 0 1",
+        "8/8/8/8/Pp6/8/8/8 b - a4 0 1",
+        "8/8/8/3pP3/8/8/8/8 b - d6 0 1",
+        "8/8/8/4P3/8/8/8/8 w - d6 0 1",
+        "8/8/8/3PP3/8/8/8/8 w - d6 0 1",
+        "rnbqkbnr/pppppppp/²²²²/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - -1 1",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 ١",
+    ],
+)
+def test_invalid_fen(fen):
+    with pytest.raises(InvalidPositionError):
+        Board.from_fen(fen)
+
+
+def test_start_position_move_count():
+    assert len(Board.from_fen(START_FEN).generate_moves()) == 20
+
+
+def test_kiwipete_move_count():
+    assert len(Board.from_fen(KIWIPETE_FEN).generate_moves()) == 48
+
+
+def test_pawn_double_step_and_blocked_pawn():
+    board = Board.from_fen("8/8/8/8/8/4n3/3PP3/8 w - - 0 1")
+    assert board.moves_from("D2") == ["D3", "D4", "E3"]
+    assert board.moves_from("E2") == []
+
+
+def test_en_passant_capture():
+    board = Board.from_fen("8/8/8/3pP3/8/8/8/8 w - d6 0 1")
+    assert board.moves_from("E5") == ["E6", "D6"]
+
+
+def test_promotion_generates_each_piece():
+    board = Board.from_fen("8/P7/8/8/8/8/8/8 w - - 0 1")
+    moves = board.generate_moves()
+    assert sorted(move.promotion for move in moves) == ["b", "n", "q", "r"]
+    assert board.moves_from("A7") == ["A8"]
+
+
+def test_sliding_figure_stops_at_blockers():
+    board = Board.from_fen("8/8/8/8/1p6/8/8/R2N4 w - - 0 1")
+    assert sorted(board.moves_from("A1")) == [
+        "A2",
+        "A3",
+        "A4",
+        "A5",
+        "A6",
+        "A7",
+        "A8",
+        "B1",
+        "C1",
+    ]
+
+
+def test_empty_board_queen_matches_figure():
+    board = Board.from_fen("8/8/8/8/3Q4/8/8/8 w - - 0 1")
+    assert board.moves_from("D4") == Queen("D4").list_available_moves()
+
+
+def test_castling_through_attacked_field_not_permitted():
+    board = Board.from_fen("4k3/8/8/8/8/8/5r2/R3K2R w KQ - 0 1")
+    moves = board.moves_from("E1")
+    assert "C1" in moves and "G1" not in moves
+
+
+def test_position_figure_in_context():
+    context = Context(PositionFigure("E2", Board.from_fen(START_FEN)))
+    assert context.list_moves() == ["E3", "E4"]
+    context.validate_move("E4")
+    with pytest.raises(MoveNotPermittedError):
+        context.validate_move("E5")
+
+
+def test_position_figure_empty_field():
+    with pytest.raises(EmptyFieldError):
+        Context(PositionFigure("E4", Board.from_fen(EMPTY_FEN))).list_moves()
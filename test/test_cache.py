@@ -0,0 +1,61 @@
+from app import app, RESPONSE_CACHE
+from cache import ResponseCache, CachedResponse, cached_entry
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = ResponseCache(2)
+    cache.set("a", CachedResponse(b"a", 200, "a"))
+    cache.set("b", CachedResponse(b"b", 200, "b"))
+    cache.get("a")
+    cache.set("c", CachedResponse(b"c", 200, "c"))
+    assert cache.get("b") is None
+    assert cache.get("a").body == b"a" and cache.get("c").body == b"c"
+    assert len(cache) == 2 and cache.hits == 3 and cache.misses == 1
+
+
+def test_response_cache_disabled_with_zero_size():
+    cache = ResponseCache(0)
+    cache.set("a", CachedResponse(b"a", 200, "a"))
+    assert cache.get("a") is None
+
+
+def test_cached_route_sends_etag_and_cache_control():
+    RESPONSE_CACHE.clear()
+    first = app.test_client().get("/api/v1/queen/D4")
+    second = app.test_client().get("/api/v1/queen/D4")
+    assert first.data == second.data and first.headers["ETag"] == second.headers["ETag"]
+    assert first.headers["Cache-Control"].startswith("public, max-age=")
+    assert RESPONSE_CACHE.hits == 1
+
+
+def test_cached_route_not_modified_response_304():
+    etag = app.test_client().get("/api/v1/rook/H4/H3").headers["ETag"]
+    response = app.test_client().get(
+        "/api/v1/rook/H4/H3", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304 and response.data == b""
+
+
+def test_cached_route_keeps_error_status():
+    for _ in range(2):
+        response = app.test_client().get("/api/v1/rook/H7/S4")
+        assert response.status_code == 409
+        assert response.json["error"] == "Current move is not permitted."
+
+
+def test_cached_error_response_is_not_revalidated():
+    assert "ETag" not in app.test_client().get("/api/v1/rook/H7/S4").headers
+    response = app.test_client().get(
+        "/api/v1/rook/H7/S4", headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == 409
+
+
+def test_invalid_paths_do_not_evict_valid_entries():
+    cache = ResponseCache(2)
+    for key in ("rook/H4", "queen/D4"):
+        cached_entry(cache, key, lambda: (dict(availableMoves=[]), 200))
+    for key in ("paulatubyla/A1", "rook/Z9", "rook/H7/S4"):
+        cached_entry(cache, key, lambda: (dict(error="Not found."), 404))
+    assert len(cache) == 2
+    assert cache.get("rook/H4") is not None and cache.get("queen/D4") is not None
@@ -316,3 +316,24 @@ class TestRook:
                 (x - 1, y + 1),
                 (x - 1, y - 1),
             ]
+
+
+class TestMoveTable:
+    def test_table_matches_generated_moves_on_every_field(self):
+        for figure_class in (Pawn, Bishop, Knight, Rook, Queen, King):
+            for field in CHESS_BOARD.flatten().tolist():
+                figure = figure_class(field)
+                assert figure.list_available_moves() == figure.generate_moves()
+
+    def test_returned_moves_do_not_alter_table(self):
+        rook = Rook("H4")
+        rook.list_available_moves().clear()
+        assert rook.list_available_moves() == rook.generate_moves()
+
+    def test_validate_move_from_field_out_of_board(self):
+        error = None
+        try:
+            King("H9").validate_move("H8")
+        except FieldOutOfBoundsError as err:
+            error = err.args[0]
+        assert error == "Field does not exist."
@@ -0,0 +1,64 @@
+import pytest
+
+from app import app
+from formats import encode_mask, encode_msgpack, encode_squares
+from squares import SQUARE_INDEX
+
+
+@pytest.mark.parametrize(
+    "value, packed",
+    [
+        (None, b"\xc0"),
+        (True, b"\xc3"),
+        (5, b"\x05"),
+        (-3, b"\xfd"),
+        (300, b"\xcd\x01\x2c"),
+        (-200, b"\xd3" + (-200).to_bytes(8, "big", signed=True)),
+        ("H3", b"\xa2H3"),
+        ("x" * 40, b"\xd9\x28" + b"x" * 40),
+        (["H3"], b"\x91\xa2H3"),
+        (list(range(16)), b"\xdc\x00\x10" + bytes(range(16))),
+        (dict(a=None), b"\x81\xa1a\xc0"),
+    ],
+)
+def test_encode_msgpack(value, packed):
+    assert encode_msgpack(value) == packed
+
+
+def test_encode_square_formats():
+    moves = dict(availableMoves=["H5", "A8"], error=None)
+    assert encode_squares(moves) == bytes([2, SQUARE_INDEX["H5"], 0])
+    assert encode_mask(moves) == (1 << SQUARE_INDEX["H5"] | 1).to_bytes(8, "big")
+    assert encode_squares(dict(move="invalid")) == b"\x00"
+    assert encode_mask(dict(availableMoves=[], error="Field does not exist.")) is None
+    assert encode_mask(dict(path=["H5"], error=None)) is None
+
+
+@pytest.mark.parametrize(
+    "accept, mimetype",
+    [
+        (None, "application/json"),
+        ("*/*", "application/json"),
+        ("application/msgpack", "application/msgpack"),
+        ("application/vnd.chess.squares", "application/vnd.chess.squares"),
+        (
+            "application/vnd.chess.mask, application/json;q=0.5",
+            "application/vnd.chess.mask",
+        ),
+    ],
+)
+def test_get_available_moves_negotiates_format(accept, mimetype):
+    headers = {"Accept": accept} if accept else {}
+    response = app.test_client().get("/api/v1/pawn/H4", headers=headers)
+    assert response.status_code == 200 and response.mimetype == mimetype
+    assert response.headers["Vary"] == "Accept"
+
+
+def test_compact_formats_fall_back_to_json():
+    client = app.test_client()
+    headers = {"Accept": "application/vnd.chess.squares"}
+    error = client.get("/api/v1/pawn/H9", headers=headers)
+    assert error.status_code == 409 and error.json["error"] == "Field does not exist."
+    board = client.get("/api/v1/board/16x16/knight/P16", headers=headers)
+    assert board.mimetype == "application/json"
+    assert client.get("/api/v1/pawn/H4", headers=headers).data == bytes([1, 31])
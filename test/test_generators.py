@@ -0,0 +1,74 @@
+import pytest
+
+from exceptions import FieldOutOfBoundsError, MoveNotPermittedError
+from objects.backends import FIGURE_BACKENDS
+from objects.Figure import Context, Rook
+from objects.generators import get_move_generator, get_move_generators
+from objects.results import FIELD_OUT_OF_BOUNDS, MOVE_NOT_PERMITTED
+from squares import SQUARES, Square
+
+
+def test_move_generators_are_flyweights():
+    first = get_move_generators(FIGURE_BACKENDS["table"])
+    second = get_move_generators(FIGURE_BACKENDS["table"])
+    assert all(first[name] is second[name] for name in first)
+
+
+@pytest.mark.parametrize("backend", ["table", "bitboard"])
+def test_move_generator_matches_figures(backend):
+    for figure_class in FIGURE_BACKENDS[backend].values():
+        generator = get_move_generator(figure_class)
+        for field in SQUARES:
+            moves = figure_class(field).list_available_moves()
+            assert list(generator.list_moves(field)) == moves
+            square = Square.parse(field)
+            assert list(generator.moves(square)) == moves
+            for dest_field in SQUARES:
+                permitted = generator.is_permitted(square, Square.parse(dest_field))
+                assert permitted == (dest_field in moves)
+
+
+def test_move_generator_validate_move():
+    generator = get_move_generator(Rook)
+    generator.validate_move("H4", "H3")
+    with pytest.raises(MoveNotPermittedError):
+        generator.validate_move("H7", "S4")
+    with pytest.raises(FieldOutOfBoundsError):
+        generator.validate_move("H10", "H9")
+
+
+def test_square_is_interned_int():
+    square = Square.parse("H4")
+    assert square is Square.parse("H4") and square == 39
+    assert square.field == "H4" and square.coordinates == (4, 7)
+    assert Square.from_coordinates(4, 7) is square
+
+
+def test_square_parse_field_out_of_board():
+    with pytest.raises(FieldOutOfBoundsError):
+        Square.parse("H9")
+
+
+def test_figures_and_context_have_no_instance_dict():
+    for figure_class in FIGURE_BACKENDS["table"].values():
+        figure = figure_class("H4")
+        assert not hasattr(figure, "__dict__")
+        assert not hasattr(Context(figure), "__dict__")
+
+
+def test_move_generator_results_without_exceptions():
+    generator = get_move_generator(Rook)
+    moves = generator.moves_result(Square.parse("H4"))
+    assert (
+        moves.ok and moves.moves == generator.list_moves("H4") and moves.error is None
+    )
+    missing = generator.moves_result(None)
+    assert not missing.ok and missing.error == "Field does not exist."
+    assert missing.code == FIELD_OUT_OF_BOUNDS
+    assert generator.validate_result(Square.parse("H4"), Square.parse("H3")).ok
+    rejected = generator.validate_result(Square.parse("H4"), None)
+    assert rejected.code == MOVE_NOT_PERMITTED
+    with pytest.raises(MoveNotPermittedError):
+        rejected.raise_for_error()
+    with pytest.raises(FieldOutOfBoundsError):
+        missing.raise_for_error()
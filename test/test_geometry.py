@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks.bench_boards import loop_table
+from exceptions import FieldOutOfBoundsError, InvalidBoardError
+from objects.backends import FIGURE_BACKENDS
+from objects.geometry import FIGURE_SHIFTS, BoardGeometry, parse_dimensions
+from objects.move_table import MOVE_TABLE
+from squares import SQUARES
+
+
+def test_eight_by_eight_matches_move_table():
+    geometry = BoardGeometry(8, 8)
+    assert geometry.fields == SQUARES
+    for name, figure_class in FIGURE_BACKENDS["table"].items():
+        for field in SQUARES:
+            assert geometry.moves(name, field) == list(
+                MOVE_TABLE.moves(figure_class, field)
+            )
+
+
+@pytest.mark.parametrize("columns, rows", [(16, 16), (26, 26), (10, 3), (1, 1)])
+def test_vectorized_tables_match_ray_walk(columns, rows):
+    geometry = BoardGeometry(columns, rows)
+    for figure in FIGURE_SHIFTS:
+        destinations, offsets = geometry.table(figure)
+        walked = loop_table(geometry, figure)
+        assert [
+            destinations[offsets[index] : offsets[index + 1]].tolist()
+            for index in range(len(geometry.fields))
+        ] == walked
+
+
+def test_generated_field_names():
+    geometry = BoardGeometry(26, 26)
+    assert geometry.fields[0] == "A26" and geometry.fields[-1] == "Z1"
+    assert geometry.moves("knight", "Z26") == ["Y24", "X25"]
+    assert geometry.is_permitted("bishop", "A1", "Z26")
+    assert not geometry.is_permitted("bishop", "A1", "Z27")
+    with pytest.raises(FieldOutOfBoundsError):
+        geometry.moves("rook", "A27")
+
+
+@pytest.mark.parametrize("dimensions", ["27x8", "0x8", "8", "x8", "8x-1"])
+def test_unsupported_dimensions(dimensions):
+    with pytest.raises(InvalidBoardError):
+        BoardGeometry(*parse_dimensions(dimensions))
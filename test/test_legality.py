@@ -0,0 +1,68 @@
+import pytest
+
+from objects.board import Board, START_FEN
+from objects.Figure import Context
+from objects.legality import (
+    LegalMoveFilter,
+    LegalPositionFigure,
+    legal_moves,
+    legal_moves_from,
+)
+
+
+@pytest.mark.parametrize(
+    "fen, count",
+    [
+        (START_FEN, 20),
+        ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 48),
+        ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 14),
+        ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 6),
+        ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 44),
+    ],
+)
+def test_legal_move_counts(fen, count):
+    assert len(legal_moves(Board.from_fen(fen))) == count
+
+
+def test_pinned_figure_moves_along_pin_ray():
+    board = Board.from_fen("4r3/8/8/8/8/8/4R3/4K3 w - - 0 1")
+    assert sorted(legal_moves_from(board, "E2")) == [
+        "E3",
+        "E4",
+        "E5",
+        "E6",
+        "E7",
+        "E8",
+    ]
+    assert (
+        legal_moves_from(Board.from_fen("7k/8/8/8/4b3/8/2N5/1K6 w - - 0 1"), "C2") == []
+    )
+
+
+def test_single_check_capture_or_block():
+    board = Board.from_fen("4r2k/8/8/8/8/8/3N4/R3K3 w - - 0 1")
+    move_filter = LegalMoveFilter(board)
+    assert move_filter.in_check
+    assert legal_moves_from(board, "A1") == []
+    assert legal_moves_from(board, "D2") == ["E4"]
+
+
+def test_double_check_only_king_moves():
+    board = Board.from_fen("4r2k/8/8/8/8/5n2/8/R3K3 w - - 0 1")
+    assert all(board.squares[move.from_index] == "K" for move in legal_moves(board))
+
+
+def test_king_cannot_step_along_checking_ray():
+    board = Board.from_fen("7k/8/8/8/8/8/8/r3K3 w - - 0 1")
+    assert "F1" not in legal_moves_from(board, "E1")
+
+
+def test_en_passant_exposing_king_on_rank():
+    board = Board.from_fen("8/8/8/K2pP2r/8/8/8/7k w - d6 0 1")
+    assert legal_moves_from(board, "E5") == ["E6"]
+
+
+def test_legal_position_figure_in_context():
+    board = Board.from_fen("4r3/8/8/8/8/8/4R3/4K3 w - - 0 1")
+    context = Context(LegalPositionFigure("E2", board))
+    assert "D2" not in context.list_moves()
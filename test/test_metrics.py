@@ -0,0 +1,43 @@
+from app import app, RESPONSE_CACHE
+from metrics import METRICS, PROFILER, Metrics, SamplingProfiler, NULL_STAGE
+
+
+def test_disabled_metrics_return_shared_null_stage():
+    metrics = Metrics(False)
+    assert metrics.stage("parse") is NULL_STAGE
+    assert "chess_stage_calls_total{" not in metrics.render()
+
+
+def test_metrics_endpoint_reports_stages_and_latency_histograms():
+    RESPONSE_CACHE.clear()
+    METRICS.enabled = True
+    METRICS.reset()
+    try:
+        app.test_client().get("/api/v1/rook/H4")
+        app.test_client().get("/api/v1/rook/H9")
+        app.test_client().get("/api/v1/paulatubyla/H4")
+        body = app.test_client().get("/metrics").data.decode()
+    finally:
+        METRICS.enabled = False
+    assert 'chess_stage_calls_total{stage="parse"} 2' in body
+    assert 'chess_stage_calls_total{stage="generate"} 1' in body
+    assert 'chess_stage_calls_total{stage="serialize"} 3' in body
+    labels = 'endpoint="handle_available_moves",figure="rook",status="200"'
+    assert f'chess_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in body
+    assert f"chess_request_duration_seconds_count{{{labels}}} 1" in body
+    assert 'figure="",status="404"' in body
+
+
+def test_sampling_profiler_collects_requests():
+    PROFILER.sample_rate = 1.0
+    try:
+        app.test_client().get("/api/v1/queen/D4")
+    finally:
+        PROFILER.sample_rate = 0.0
+    report = app.test_client().get("/metrics/profile").data.decode()
+    assert "function calls" in report
+
+
+def test_sampling_profiler_disabled():
+    assert SamplingProfiler(0.0).start() is None
+    assert SamplingProfiler(0.0).report() == "No profiled requests.\n"
@@ -0,0 +1,43 @@
+from objects.backends import FIGURE_BACKENDS
+from objects.batch import validate_moves_batch
+from objects.board import Board, START_FEN
+from objects.parallel import (
+    create_pool,
+    parallel_divide,
+    parallel_perft,
+    split_perft,
+    validate_moves_parallel,
+)
+from objects.perft import divide
+from squares import SQUARES
+
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def test_split_perft_expands_until_enough_tasks():
+    board = Board.from_fen(START_FEN)
+    assert len(split_perft(board, 1, 100)) == 20
+    assert len(split_perft(board, 3, 100)) == 400
+    assert board.to_fen() == START_FEN
+
+
+def test_parallel_divide_matches_divide():
+    board = Board.from_fen(KIWIPETE_FEN)
+    assert parallel_divide(board, 3, workers=2) == divide(board, 3)
+    assert parallel_perft(board, 1, workers=1) == 48
+    assert board.to_fen() == KIWIPETE_FEN
+
+
+def test_validate_moves_parallel_matches_batch():
+    figure_classes = FIGURE_BACKENDS["table"]
+    names = list(figure_classes) + ["paulatubyla"]
+    figures = [names[index % len(names)] for index in range(500)]
+    currents = [SQUARES[index % 64] for index in range(499)] + ["H9"]
+    dests = [SQUARES[index * 7 % 64] for index in range(500)]
+    expected = validate_moves_batch(figure_classes, figures, currents, dests)
+    with create_pool(2, figure_classes) as pool:
+        valid, errors = validate_moves_parallel(
+            figure_classes, figures, currents, dests, pool=pool, chunk_size=64
+        )
+    assert valid.tolist() == expected[0].tolist()
+    assert errors.tolist() == expected[1].tolist()
@@ -0,0 +1,32 @@
+from objects.backends import FIGURE_BACKENDS
+from objects.Figure import Bishop, King, Knight, Pawn, Queen, Rook
+from objects.paths import PATH_TABLE
+from squares import SQUARES
+
+
+def test_paths_are_made_of_permitted_moves():
+    for figure_class in FIGURE_BACKENDS["table"].values():
+        for field in SQUARES:
+            for dest_field in SQUARES:
+                path = PATH_TABLE.path(figure_class, field, dest_field)
+                distance = PATH_TABLE.distance(figure_class, field, dest_field)
+                if path is None:
+                    assert distance is None
+                    continue
+                assert len(path) == distance
+                current = field
+                for step in path:
+                    assert step in figure_class(current).list_available_moves()
+                    current = step
+                assert current == dest_field
+
+
+def test_known_distances():
+    assert PATH_TABLE.distance(Knight, "A1", "H8") == 6
+    assert PATH_TABLE.distance(Knight, "A1", "B2") == 4
+    assert PATH_TABLE.distance(King, "A1", "H8") == 7
+    assert PATH_TABLE.distance(Queen, "A1", "B3") == 2
+    assert PATH_TABLE.distance(Rook, "A1", "H8") == 2
+    assert PATH_TABLE.distance(Bishop, "A1", "A2") is None
+    assert PATH_TABLE.distance(Pawn, "H4", "H3") is None
+    assert PATH_TABLE.path(King, "D4", "D4") == []
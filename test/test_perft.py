@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from objects.board import Board, START_FEN
+from objects.legality import legal_moves
+from objects.perft import divide, move_name, perft
+
+KIWIPETE_FEN = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+@pytest.mark.parametrize(
+    "fen, depth, nodes",
+    [
+        (START_FEN, 3, 8902),
+        (KIWIPETE_FEN, 2, 2039),
+        ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 4, 43238),
+        ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 3, 9467),
+        ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 2, 1486),
+    ],
+)
+def test_perft(fen, depth, nodes):
+    board = Board.from_fen(fen)
+    assert perft(board, depth) == nodes
+    assert board.to_fen() == fen
+
+
+def test_divide_sums_to_perft():
+    board = Board.from_fen(KIWIPETE_FEN)
+    split = divide(board, 2)
+    assert sum(split.values()) == 2039 and len(split) == 48
+    assert "e1g1" in {move_name(move) for move in split}
+
+
+def test_incremental_hash_matches_full_hash_and_unmake_restores():
+    rng = random.Random(3)
+    board = Board.from_fen(KIWIPETE_FEN)
+    history = list()
+    for _ in range(60):
+        moves = legal_moves(board)
+        if not moves:
+            break
+        history.append((board.to_fen(), board.hash))
+        board.make_move(rng.choice(moves))
+        assert board.hash == board.compute_hash()
+    while history:
+        board.unmake_move()
+        assert (board.to_fen(), board.hash) == history.pop()
+
+
+def test_transpositions_share_hash():
+    first, second = Board.from_fen(START_FEN), Board.from_fen(START_FEN)
+    for board, moves in ((first, "g1f3 g8f6 b1c3"), (second, "b1c3 g8f6 g1f3")):
+        for name in moves.split():
+            move = next(m for m in legal_moves(board) if move_name(m) == name)
+            board.make_move(move)
+    assert first.hash == second.hash and first.squares == second.squares
+    assert first.hash != Board.from_fen(START_FEN).hash
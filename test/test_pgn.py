@@ -0,0 +1,102 @@
+import gzip
+import json
+
+import pytest
+
+from exceptions import InvalidNotationError, MoveNotPermittedError
+from objects.board import Board, START_FEN
+from objects.perft import move_name
+from objects.pgn import parse_san, read_games, san_tokens, validate_game
+from validate_pgn import main
+
+GAMES = """[Event "Scholar"]
+[White "A"]
+[Result "1-0"]
+
+1. e4 e5 2. Bc4 {attacks f7} Nc6 (2... Nf6 3. d3 (3. Ng5)) 3. Qh5 Nf6?? $4
+4. Qxf7# 1-0
+
+[Event "Illegal"]
+[Result "*"]
+
+1.e4 e5 2.Ke3 *
+"""
+
+
+def test_san_tokens_skip_comments_variations_and_results():
+    _, movetext = next(read_games(GAMES.splitlines()))
+    assert list(san_tokens(movetext)) == [
+        "e4",
+        "e5",
+        "Bc4",
+        "Nc6",
+        "Qh5",
+        "Nf6??",
+        "Qxf7#",
+    ]
+
+
+@pytest.mark.parametrize(
+    "fen, san, name",
+    [
+        (START_FEN, "Nf3", "g1f3"),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", "O-O-O", "e1c1"),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", "O-O+", "e1g1"),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", "Rad1", "a1d1"),
+        ("7k/P7/8/8/8/8/8/K7 w - - 0 1", "a8=N", "a7a8n"),
+        ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", "exd6", "e5d6"),
+        ("4k3/8/8/8/4p3/3P4/8/4K3 w - - 0 1", "dxe4", "d3e4"),
+        ("4k3/8/8/8/4p3/3P4/8/4K3 w - - 0 1", "d4", "d3d4"),
+    ],
+)
+def test_parse_san(fen, san, name):
+    assert move_name(parse_san(Board.from_fen(fen), san)) == name
+
+
+def test_parse_san_errors():
+    board = Board.from_fen("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1")
+    with pytest.raises(InvalidNotationError):
+        parse_san(Board.from_fen("4k3/8/8/8/8/8/4K3/R6R w - - 0 1"), "Rd1")
+    with pytest.raises(InvalidNotationError):
+        parse_san(board, "Zz9")
+    with pytest.raises(MoveNotPermittedError):
+        parse_san(board, "Ke3")
+
+
+@pytest.mark.parametrize(
+    "fen, san",
+    [
+        ("4k3/8/8/8/4p3/3P4/8/4K3 w - - 0 1", "e4"),
+        ("4k3/8/8/8/8/4P3/8/4K3 w - - 0 1", "exe4"),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", "Kg1"),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", "Kc1"),
+    ],
+)
+def test_parse_san_rejects_mismatched_move_kind(fen, san):
+    with pytest.raises(MoveNotPermittedError):
+        parse_san(Board.from_fen(fen), san)
+
+
+def test_parse_san_pawn_capture_names_its_file():
+    with pytest.raises(InvalidNotationError):
+        parse_san(Board.from_fen("4k3/8/8/8/4p3/3P4/8/4K3 w - - 0 1"), "xe4")
+
+
+def test_validate_game_stops_at_first_illegal_move():
+    scholar, illegal = read_games(GAMES.splitlines())
+    assert validate_game(scholar)["plies"] == 7 and validate_game(scholar)["valid"]
+    result = validate_game(illegal)
+    assert result["plies"] == 2 and not result["valid"] and result["move"] == "Ke3"
+
+
+def test_cli_streams_gzip_archive(tmp_path, capsys):
+    archive = tmp_path / "games.pgn.gz"
+    with gzip.open(archive, "wt") as file:
+        file.write(GAMES * 3)
+    output = tmp_path / "results.jsonl"
+    summary = main([str(archive), "--output", str(output), "--invalid-only"])
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line["game"] for line in lines] == [2, 4, 6]
+    assert summary["games"] == 6 and summary["invalid"] == 3
+    assert summary["moves"] == 27 and summary["moves_per_sec"] > 0
+    assert json.loads(capsys.readouterr().err) == summary
@@ -0,0 +1,63 @@
+import pytest
+
+from app import app
+from exceptions import FieldOutOfBoundsError
+from objects.Figure import Knight, Queen
+from objects.puzzles import eight_queens, knights_tour, queen_coverage
+from squares import SQUARES
+
+
+def test_knights_tour_from_every_field():
+    for field in SQUARES:
+        tour, _ = knights_tour(field, 1.0)
+        assert tour[0] == field and sorted(tour) == sorted(SQUARES)
+        for current, dest in zip(tour, tour[1:]):
+            assert dest in Knight(current).list_available_moves()
+    with pytest.raises(FieldOutOfBoundsError):
+        knights_tour("A9", 1.0)
+
+
+def test_eight_queens_finds_all_92_solutions():
+    solutions, _ = eight_queens(5.0)
+    assert len({tuple(solution) for solution in solutions}) == 92
+    for solution in solutions:
+        for index, field in enumerate(solution):
+            attacked = Queen(field).list_available_moves()
+            assert not any(other in attacked for other in solution[index + 1 :])
+
+
+def test_queen_coverage_is_five_queens():
+    queens, _ = queen_coverage(30.0)
+    covered = set(queens)
+    for field in queens:
+        covered.update(Queen(field).list_available_moves())
+    assert len(queens) == 5 and covered == set(SQUARES)
+
+
+def test_solver_stops_at_time_budget():
+    queens, nodes = queen_coverage(0.0)
+    assert queens is None and nodes > 0
+
+
+def test_get_knights_tour_response_200():
+    response = app.test_client().get("/api/v1/puzzles/knights-tour/D4")
+    assert response.status_code == 200 and len(response.json["tour"]) == 64
+
+
+def test_get_eight_queens_response_200():
+    response = app.test_client().get("/api/v1/puzzles/eight-queens?budget=2")
+    assert response.status_code == 200 and response.json["count"] == 92
+
+
+@pytest.mark.parametrize(
+    "url, status",
+    [
+        ("/api/v1/puzzles/knights-tour/D9", 409),
+        ("/api/v1/puzzles/knights-tour/D4?budget=soon", 400),
+        ("/api/v1/puzzles/queen-coverage?budget=0", 400),
+        ("/api/v1/puzzles/queen-coverage?budget=0.000001", 409),
+    ],
+)
+def test_get_puzzle_errors(url, status):
+    response = app.test_client().get(url)
+    assert response.status_code == status and response.json["error"] is not None
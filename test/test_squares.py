@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+from exceptions import FieldOutOfBoundsError
+from settings import CHESS_BOARD, CHESS_FIELDS
+from squares import (
+    SQUARES,
+    field_to_index,
+    field_to_coordinates,
+    index_to_field,
+    index_to_coordinates,
+    coordinates_to_index,
+    coordinates_to_field,
+)
+from utils import get_field_coordinates
+
+
+def test_field_coordinates_match_chess_board():
+    for x, row in enumerate(CHESS_BOARD.tolist()):
+        for y, field in enumerate(row):
+            assert get_field_coordinates(field) == (x, y)
+            assert coordinates_to_field(x, y) == field
+
+
+def test_index_round_trip():
+    for index, field in enumerate(SQUARES):
+        assert field_to_index(field) == index
+        assert index_to_field(index) == field
+        assert coordinates_to_index(*index_to_coordinates(index)) == index
+
+
+def test_h4_coordinates():
+    assert field_to_coordinates("H4") == (4, 7)
+
+
+@pytest.mark.parametrize("field", ["H9", "S4", "", "h4", None])
+def test_invalid_field_raises_field_out_of_bounds(field):
+    with pytest.raises(FieldOutOfBoundsError) as err:
+        get_field_coordinates(field)
+    assert err.value.args[0] == "Field does not exist."
+
+
+@pytest.mark.parametrize("x, y", [(-1, 0), (0, 8), (8, 8)])
+def test_invalid_coordinates_raise_field_out_of_bounds(x, y):
+    with pytest.raises(FieldOutOfBoundsError):
+        coordinates_to_index(x, y)
+
+
+@pytest.mark.parametrize("index", [-1, 64])
+def test_invalid_index_raises_field_out_of_bounds(index):
+    with pytest.raises(FieldOutOfBoundsError):
+        index_to_field(index)
+
+
+def test_importing_app_does_not_import_numpy():
+    code = "import sys, app; print('numpy' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "False"
+
+
+def test_chess_board_is_built_from_chess_fields():
+    assert CHESS_BOARD.tolist() == [list(row) for row in CHESS_FIELDS]
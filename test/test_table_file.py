@@ -0,0 +1,44 @@
+from objects.backends import FIGURE_BACKENDS
+from objects.move_table import MOVE_TABLE, MoveTable
+from objects.paths import PATH_TABLE
+from objects.table_file import (
+    HEADER,
+    TableFile,
+    build_table_file,
+    load_table_file,
+)
+
+CLASS_NAMES = FIGURE_BACKENDS["table"]
+
+
+def test_table_file_round_trip(tmp_path):
+    path = tmp_path / "tables.bin"
+    assert build_table_file(str(path)) == path.stat().st_size
+    table_file = TableFile(str(path))
+    for figure_class in CLASS_NAMES.values():
+        assert table_file.moves(figure_class) == MoveTable().table(figure_class)
+        distances, parents = table_file.paths(figure_class)
+        expected_distances, expected_parents = PATH_TABLE.tables(figure_class)
+        assert bytes(distances) == expected_distances.tobytes()
+        assert bytes(parents) == expected_parents.tobytes()
+
+
+def test_load_table_file_installs_tables(tmp_path):
+    path = tmp_path / "tables.bin"
+    build_table_file(str(path))
+    assert load_table_file(str(path), FIGURE_BACKENDS["bitboard"])
+    bitboard_queen = FIGURE_BACKENDS["bitboard"]["queen"]
+    assert MOVE_TABLE.table(bitboard_queen) == MOVE_TABLE.table(CLASS_NAMES["queen"])
+    assert PATH_TABLE.path(bitboard_queen, "A1", "H7") == ["G7", "H7"]
+
+
+def test_invalid_table_file_falls_back(tmp_path):
+    path = tmp_path / "tables.bin"
+    assert not load_table_file(str(path))
+    build_table_file(str(path))
+    data = bytearray(path.read_bytes())
+    data[HEADER.size + 100] ^= 1
+    path.write_bytes(bytes(data))
+    assert not load_table_file(str(path))
+    path.write_bytes(b"CHESSTBL\x63\x00" + bytes(data[10:]))
+    assert not load_table_file(str(path))
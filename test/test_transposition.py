@@ -0,0 +1,78 @@
+import pytest
+
+from exceptions import MoveNotPermittedError
+from objects.board import Board, START_FEN
+from objects.legality import legal_moves_from
+from objects.transposition import (
+    ENTRY_BYTES,
+    CachedPositionFigure,
+    TranspositionTable,
+    cached_legal_moves_from,
+    position_key,
+)
+
+
+def test_table_size_is_capped_power_of_two():
+    table = TranspositionTable(1 << 20)
+    assert table.size_bytes <= 1 << 20 < table.size_bytes * 2
+    assert table.entries & (table.entries - 1) == 0
+    assert table.entries * ENTRY_BYTES == table.size_bytes
+
+
+def test_probe_and_store():
+    table = TranspositionTable(1 << 16)
+    assert table.probe(12345) is None
+    table.store(12345, [3, 1, 2], 0b1110)
+    assert table.probe(12345) == ((3, 1, 2), 0b1110)
+    assert table.probe(12345 + table.entries) is None
+    assert table.stats()["hitRate"] == pytest.approx(1 / 3)
+
+
+def test_always_replace_policy():
+    table = TranspositionTable(1 << 16, "always")
+    table.store(1, [1], 2, depth=5)
+    assert table.store(1 + table.entries, [2], 4, depth=0)
+    assert table.probe(1) is None and table.replacements == 1
+
+
+def test_depth_preferred_policy():
+    table = TranspositionTable(1 << 16, "depth")
+    table.store(1, [1], 2, depth=5)
+    assert not table.store(1 + table.entries, [2], 4, depth=0)
+    assert table.probe(1) == ((1,), 2) and table.rejections == 1
+    assert table.store(1 + table.entries, [2], 4, depth=6)
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        TranspositionTable(1 << 16, "never")
+
+
+def test_cached_moves_match_legal_moves():
+    table = TranspositionTable(1 << 16)
+    board = Board.from_fen(START_FEN)
+    for field in ("G1", "E2", "B8"):
+        first, _ = cached_legal_moves_from(table, board, field)
+        second, _ = cached_legal_moves_from(table, board, field)
+        assert first == second == legal_moves_from(board, field)
+    assert table.hits == 3 and table.stores == 3
+
+
+def test_cached_position_figure_validates_with_mask():
+    table = TranspositionTable(1 << 16)
+    figure = CachedPositionFigure("E2", Board.from_fen(START_FEN), table)
+    figure.validate_move("E4")
+    with pytest.raises(MoveNotPermittedError):
+        figure.validate_move("E5")
+    with pytest.raises(MoveNotPermittedError):
+        figure.validate_move("S4")
+
+
+def test_depth_preferred_keeps_longer_move_lists():
+    table = TranspositionTable(1 << 16, "depth")
+    board = Board.from_fen("8/8/8/3Q4/8/8/8/7K w - - 0 1")
+    cached_legal_moves_from(table, board, "D5")
+    key = position_key(board, "D5")
+    # same slot, different key
+    assert not table.store(key ^ table.entries, [1], 2, depth=1)
+    assert table.probe(key) is not None and table.rejections == 1
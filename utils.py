@@ -1,7 +1,5 @@
-import numpy as np
-
-from exceptions import FieldOutOfBoundsError
-from settings import CHESS_BOARD, CHESS_DIMENSION
+from settings import CHESS_DIMENSION
+from squares import field_to_coordinates
 
 
 def is_in_bounds(x: int, y: int) -> bool:
@@ -16,8 +14,4 @@ def is_in_bounds(x: int, y: int) -> bool:
 
 def get_field_coordinates(field: str) -> (int, int):
     # checks if position is on the board
-    x, y = np.where(CHESS_BOARD == field)
-    if not is_in_bounds(x, y):
-        raise FieldOutOfBoundsError("Field does not exist.")
-    else:
-        return x[0], y[0]
+    return field_to_coordinates(field)
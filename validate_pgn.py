@@ -0,0 +1,55 @@
+import argparse
+import json
+import sys
+import time
+from contextlib import nullcontext
+
+from objects.parallel import create_pool
+from objects.pgn import open_pgn, read_games, validate_games
+
+
+def read_archives(paths: list):
+    for path in paths:
+        if path == "-":
+            yield from read_games(sys.stdin)
+            continue
+        with open_pgn(path) as lines:
+            yield from read_games(lines)
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Validate games of PGN archives")
+    parser.add_argument("paths", nargs="+", help="PGN or gzip PGN files, - for stdin")
+    parser.add_argument("--output", default="-", help="JSON lines file, - for stdout")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--invalid-only", action="store_true")
+    args = parser.parse_args(argv)
+
+    games = moves = invalid = 0
+    start = time.perf_counter()
+    output = nullcontext(sys.stdout) if args.output == "-" else open(args.output, "w")
+    pool = create_pool(args.workers) if args.workers > 1 else None
+    with pool or nullcontext(), output as output:
+        results = validate_games(read_archives(args.paths), pool)
+        for number, result in enumerate(results, 1):
+            games += 1
+            moves += result["plies"]
+            invalid += not result["valid"]
+            if result["valid"] and args.invalid_only:
+                continue
+            output.write(json.dumps(dict(game=number, **result)) + "\n")
+    seconds = time.perf_counter() - start
+    summary = dict(
+        games=games,
+        invalid=invalid,
+        moves=moves,
+        seconds=seconds,
+        games_per_sec=games / seconds if seconds else None,
+        moves_per_sec=moves / seconds if seconds else None,
+    )
+    print(json.dumps(summary), file=sys.stderr)
+    return summary
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main()["invalid"] else 0)
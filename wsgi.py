@@ -0,0 +1,11 @@
+from app import app, CLASS_NAMES
+from objects.move_table import MOVE_TABLE
+
+
+def warm_move_tables() -> None:
+    # built before gunicorn forks, so preloaded workers share the tables
+    for figure_class in CLASS_NAMES.values():
+        MOVE_TABLE.table(figure_class)
+
+
+warm_move_tables()